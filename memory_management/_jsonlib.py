@@ -0,0 +1,77 @@
+"""
+JSON backend shared by the memory management modules.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so callers get the faster C parser without a hard dependency.
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _encode_dataclass(obj: Any) -> Any:
+    """Encode dataclass instances field by field for the standard library encoder."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON text as str or bytes
+
+    Returns:
+        Deserialized Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON string (non-ASCII characters are kept as-is)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    With orjson this is its native output, so no intermediate str is built.
+    Dataclass instances are serialized field by field directly, without
+    converting them to dictionaries first.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'),
+                      default=_encode_dataclass).encode('utf-8')
@@ -1,6 +1,6 @@
 """LLM integration module for memory management."""
 
 from .client import LLMClient
-from .prompts import PromptTemplates
+from .prompts import PromptTemplates, TEMPLATES
 
-__all__ = ['LLMClient', 'PromptTemplates']
\ No newline at end of file
+__all__ = ['LLMClient', 'PromptTemplates', 'TEMPLATES']
\ No newline at end of file
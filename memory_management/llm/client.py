@@ -1,18 +1,89 @@
 """Ollama LLM client for structured data extraction."""
 
+import asyncio
+import hashlib
 import json
+import re
+import threading
 import time
 import logging
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .. import _jsonlib
+from .prompts import compile_schema_validator
+
 logger = logging.getLogger(__name__)
 
+# Reasoning/artifact blocks stripped from LLM output before JSON parsing,
+# matched in a single scan: <think>, <reasoning> and <analysis>
+_ARTIFACT_BLOCK_RE = re.compile(
+    r'<(think|reasoning|analysis)>.*?</\1>',
+    re.IGNORECASE | re.DOTALL
+)
+_RESPONSE_PREFIX = 'response:'
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _strip_llm_artifacts(content: str) -> str:
+    """Remove reasoning blocks and a leading 'Response:' label from LLM output."""
+    # Remove <think>, <reasoning> and <analysis> blocks (case insensitive, multiline)
+    cleaned = _ARTIFACT_BLOCK_RE.sub('', content).strip()
+    
+    # If the response starts with "Response:" or similar, try to extract just the JSON part
+    if cleaned[:len(_RESPONSE_PREFIX)].lower() == _RESPONSE_PREFIX:
+        cleaned = cleaned[len(_RESPONSE_PREFIX):].lstrip()
+    
+    return cleaned
+
+
+def _json_document_complete(text: str) -> bool:
+    """Check whether partial LLM output already contains a complete JSON document."""
+    cleaned = _strip_llm_artifacts(text)
+    if not cleaned.startswith(('{', '[')):
+        return False
+    try:
+        _JSON_DECODER.raw_decode(cleaned)
+        return True
+    except ValueError:
+        return False
+
+
+def _schema_key(schema: Any) -> str:
+    """
+    Return a compact string identifying a schema description.
+    
+    Key order is preserved because the schema is rendered into prompts as-is.
+    """
+    return json.dumps(schema, separators=(',', ':'))
+
+
+@lru_cache(maxsize=256)
+def _schema_prompt_text(schema_key: str) -> str:
+    """Render a schema description for inclusion in a prompt, once per schema."""
+    return _jsonlib.dumps(json.loads(schema_key), indent=True)
+
+
+@lru_cache(maxsize=128)
+def _compiled_schema_validator(schema_key: str) -> Callable[[Any], List[str]]:
+    """
+    Build the validator for a schema description once and reuse it.
+    
+    Args:
+        schema_key: Schema string from ``_schema_key``
+        
+    Returns:
+        Function returning the list of problems found in a decoded response
+    """
+    return compile_schema_validator(json.loads(schema_key))
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM API call."""
     content: str
@@ -20,6 +91,7 @@ class LLMResponse:
     success: bool
     error: Optional[str] = None
     tokens_used: Optional[int] = None
+    parsed: Optional[Any] = None
 
 
 class LLMClient:
@@ -31,11 +103,16 @@ class LLMClient:
         'gemma3:27b': 'gemma3:27b'
     }
     
+    # Seconds a model-availability result from check_health is reused
+    HEALTH_CACHE_TTL = 30.0
+    
     def __init__(self, 
                  base_url: str = "http://localhost:11434",
                  timeout: int = 120,
                  max_retries: int = 3,
-                 retry_delay: float = 1.0):
+                 retry_delay: float = 1.0,
+                 pool_maxsize: int = 10,
+                 cache_size: int = 256):
         """
         Initialize Ollama LLM client.
         
@@ -44,11 +121,20 @@ class LLMClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_delay: Initial delay between retries in seconds
+            pool_maxsize: Maximum number of keep-alive connections kept per host,
+                which bounds how many concurrent requests reuse a connection
+            cache_size: Maximum number of successful generations kept for
+                identical requests (0 disables response caching)
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.pool_maxsize = pool_maxsize
+        self._health_cache: Optional[tuple] = None  # (expires_at, healthy)
+        self.cache_size = cache_size
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
         
         # Configure session with retry strategy
         self.session = requests.Session()
@@ -58,17 +144,28 @@ class LLMClient:
             allowed_methods=["HEAD", "GET", "POST"],
             backoff_factor=1
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=pool_maxsize
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    def _make_request(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _make_request(self,
+                      endpoint: str,
+                      data: Dict[str, Any],
+                      stop_when: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
         """
         Make HTTP request to Ollama API with error handling.
         
+        Requests with ``data['stream']`` set are read as newline-delimited JSON
+        chunks and merged into the same shape as a non-streamed response.
+        
         Args:
             endpoint: API endpoint
             data: Request payload
+            stop_when: For streamed requests, predicate on the text received so
+                far; reading stops early once it returns True
             
         Returns:
             Response data
@@ -78,15 +175,19 @@ class LLMClient:
         """
         url = f"{self.base_url}/{endpoint}"
         headers = {'Content-Type': 'application/json'}
+        stream = bool(data.get('stream'))
         
         try:
             response = self.session.post(
                 url, 
                 json=data, 
                 headers=headers, 
-                timeout=self.timeout
+                timeout=self.timeout,
+                **({'stream': True} if stream else {})
             )
             response.raise_for_status()
+            if stream:
+                return self._read_stream(response, stop_when)
             return response.json()
         except requests.exceptions.Timeout:
             logger.error(f"Request timeout after {self.timeout}s for {url}")
@@ -104,21 +205,80 @@ class LLMClient:
             logger.error(f"Unexpected error calling Ollama API: {str(e)}")
             raise
     
+    @staticmethod
+    def _read_stream(response: requests.Response,
+                     stop_when: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """
+        Collect a streamed Ollama response.
+        
+        Args:
+            response: Streaming HTTP response
+            stop_when: Optional predicate on the text received so far
+            
+        Returns:
+            Final chunk data with the concatenated text under 'response'
+            
+        Raises:
+            requests.exceptions.RequestException: If the stream reports an
+                error, or ends before completion without ``stop_when`` firing
+        """
+        pieces = []
+        final_chunk: Optional[Dict[str, Any]] = None
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _jsonlib.loads(line)
+                if 'error' in chunk:
+                    raise requests.exceptions.RequestException(f"Ollama stream error: {chunk['error']}")
+                
+                piece = chunk.get('response', '')
+                pieces.append(piece)
+                if chunk.get('done'):
+                    final_chunk = chunk
+                    break
+                # A JSON document can only become complete on a closing bracket
+                if stop_when is not None and ('}' in piece or ']' in piece) and stop_when(''.join(pieces)):
+                    logger.debug("Stopping LLM stream early: complete JSON document received")
+                    # Each streamed chunk carries one generated token
+                    final_chunk = {'eval_count': len(pieces)}
+                    break
+        finally:
+            response.close()
+        
+        # Truncated output must not be reported as a successful generation
+        if final_chunk is None:
+            raise requests.exceptions.RequestException("Ollama stream ended before completion")
+        
+        final_chunk['response'] = ''.join(pieces)
+        return final_chunk
+    
     def generate(self, 
                  prompt: str, 
                  model: str = 'qwq:32b',
                  system_prompt: Optional[str] = None,
                  temperature: float = 0.1,
-                 max_tokens: Optional[int] = None) -> LLMResponse:
+                 max_tokens: Optional[int] = None,
+                 use_cache: bool = True,
+                 stream: bool = False,
+                 stop_at_json: bool = False) -> LLMResponse:
         """
         Generate text using Ollama model.
         
+        Successful generations are remembered per (model, system prompt,
+        prompt, sampling options), so repeating an identical request returns
+        the earlier output without another inference.
+        
         Args:
             prompt: Input prompt
             model: Model name to use
             system_prompt: Optional system prompt
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
+            use_cache: Reuse a cached output for an identical request
+            stream: Read the output incrementally instead of as one buffered body
+            stop_at_json: With ``stream``, stop reading as soon as a complete
+                JSON document has been received
             
         Returns:
             LLMResponse with generated content
@@ -126,10 +286,19 @@ class LLMClient:
         if model not in self.MODELS:
             raise ValueError(f"Unsupported model: {model}. Supported: {list(self.MODELS.keys())}")
         
+        cache_key = None
+        if use_cache and self.cache_size > 0:
+            cache_key = self._response_cache_key(
+                model, system_prompt, prompt, temperature, max_tokens, stream and stop_at_json
+            )
+            cached = self._cached_llm_response(cache_key, model)
+            if cached is not None:
+                return cached
+        
         data = {
             'model': self.MODELS[model],
             'prompt': prompt,
-            'stream': False,
+            'stream': stream,
             'options': {
                 'temperature': temperature,
             }
@@ -143,13 +312,21 @@ class LLMClient:
         
         try:
             logger.info(f"Generating text with model {model}")
-            response_data = self._make_request('api/generate', data)
+            if stream and stop_at_json:
+                response_data = self._make_request('api/generate', data, stop_when=_json_document_complete)
+            else:
+                response_data = self._make_request('api/generate', data)
+            content = response_data.get('response', '')
+            tokens_used = response_data.get('eval_count')
+            
+            if cache_key is not None:
+                self._store_cached_response(cache_key, (content, tokens_used))
             
             return LLMResponse(
-                content=response_data.get('response', ''),
+                content=content,
                 model=model,
                 success=True,
-                tokens_used=response_data.get('eval_count')
+                tokens_used=tokens_used
             )
             
         except Exception as e:
@@ -161,11 +338,57 @@ class LLMClient:
                 error=str(e)
             )
     
+    @staticmethod
+    def _response_cache_key(model: str,
+                            system_prompt: Optional[str],
+                            prompt: str,
+                            temperature: float,
+                            max_tokens: Optional[int],
+                            truncated: bool = False) -> str:
+        """Hash the parameters that determine a generation into a cache key."""
+        payload = json.dumps([model, system_prompt, prompt, temperature, max_tokens, truncated])
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cached_llm_response(self, key: str, model: str) -> Optional[LLMResponse]:
+        """Build a response from a cached generation, or return None on a miss."""
+        cached = self._get_cached_response(key)
+        if cached is None:
+            return None
+        logger.debug(f"Using cached generation for model {model}")
+        return LLMResponse(
+            content=cached[0],
+            model=model,
+            success=True,
+            tokens_used=cached[1]
+        )
+    
+    def _get_cached_response(self, key: str) -> Optional[tuple]:
+        """Return a cached (content, tokens_used) pair and mark it recently used."""
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+            return cached
+    
+    def _store_cached_response(self, key: str, value: tuple):
+        """Store a generation result, evicting the least recently used entry."""
+        with self._response_cache_lock:
+            self._response_cache[key] = value
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached generation results."""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+    
     def extract_structured_data(self, 
                                prompt: str, 
                                expected_schema: Dict[str, Any],
                                model: str = 'qwq:32b',
-                               system_prompt: Optional[str] = None) -> LLMResponse:
+                               system_prompt: Optional[str] = None,
+                               input_text: Optional[str] = None) -> LLMResponse:
         """
         Extract structured data using LLM with JSON schema validation.
         
@@ -174,45 +397,72 @@ class LLMClient:
             expected_schema: Expected JSON schema for validation
             model: Model name to use
             system_prompt: Optional system prompt
+            input_text: Optional per-request input placed after the JSON
+                instructions, so that ``prompt`` and the schema form a prefix
+                shared by every request and the server can reuse its cache
             
         Returns:
-            LLMResponse with structured JSON data
+            LLMResponse with structured JSON data; the decoded object is
+            available as ``parsed``
         """
+        schema_key = _schema_key(expected_schema)
+        
         # Add JSON formatting instruction to prompt
         json_prompt = f"""{prompt}
 
 Please respond with valid JSON only, following this structure:
-{json.dumps(expected_schema, indent=2)}
+{_schema_prompt_text(schema_key)}
 
-Response:"""
+"""
+        if input_text is not None:
+            json_prompt += f"{input_text}\n\n"
+        json_prompt += "Response:"
         
         if not system_prompt:
             system_prompt = "You are a data extraction assistant. Extract information and respond with valid JSON only."
         
-        response = self.generate(
-            prompt=json_prompt,
-            model=model,
-            system_prompt=system_prompt,
-            temperature=0.1  # Low temperature for consistent structured output
-        )
+        temperature = 0.1  # Low temperature for consistent structured output
         
-        if not response.success:
-            return response
+        # The raw output is only cached once it has decoded as JSON, so a
+        # malformed generation is retried instead of being replayed
+        cache_key = None
+        response = None
+        if self.cache_size > 0:
+            cache_key = self._response_cache_key(model, system_prompt, json_prompt, temperature, None, True)
+            response = self._cached_llm_response(cache_key, model)
+        
+        if response is None:
+            response = self.generate(
+                prompt=json_prompt,
+                model=model,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                use_cache=False,
+                stream=True,
+                stop_at_json=True  # Skip trailing explanation after the JSON document
+            )
+            
+            if not response.success:
+                return response
         
         # Try to parse and validate JSON response
         try:
             # Clean the response content by removing <think>...</think> blocks
-            cleaned_content = self._clean_llm_response(response.content)
+            raw_content = response.content
+            cleaned_content = self._clean_llm_response(raw_content)
             
-            parsed_json = json.loads(cleaned_content.strip())
-            # Basic schema validation - check if required keys exist
-            if isinstance(expected_schema, dict):
-                for key in expected_schema.keys():
-                    if key not in parsed_json:
-                        logger.warning(f"Missing expected key '{key}' in LLM response")
+            parsed_json = _jsonlib.loads(cleaned_content)
+            if cache_key is not None:
+                self._store_cached_response(cache_key, (raw_content, response.tokens_used))
+            # Basic schema validation - check required keys and value types
+            validator = _compiled_schema_validator(schema_key)
+            for problem in validator(parsed_json):
+                logger.warning(f"{problem} in LLM response")
             
-            # Update response with validated JSON
-            response.content = json.dumps(parsed_json, indent=2)
+            # Keep the validated JSON text as-is and expose the decoded object
+            # so callers do not have to parse it a second time
+            response.content = cleaned_content
+            response.parsed = parsed_json
             return response
             
         except json.JSONDecodeError as e:
@@ -225,13 +475,84 @@ Response:"""
                 error=f"Invalid JSON response: {str(e)}"
             )
     
+    async def generate_async(self, prompt: str, **kwargs) -> LLMResponse:
+        """
+        Asynchronous variant of :meth:`generate`.
+        
+        The blocking request runs in a worker thread so callers on an event loop
+        can keep several generations in flight over the pooled session.
+        
+        Args:
+            prompt: Input prompt
+            **kwargs: Keyword arguments forwarded to :meth:`generate`
+            
+        Returns:
+            LLMResponse with generated content
+        """
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
+    
+    async def generate_batch(self,
+                             prompts: List[str],
+                             model: str = 'qwq:32b',
+                             max_concurrency: Optional[int] = None,
+                             **kwargs) -> List[LLMResponse]:
+        """
+        Generate text for several prompts concurrently.
+        
+        Args:
+            prompts: Input prompts
+            model: Model name to use
+            max_concurrency: Maximum number of in-flight requests
+                (defaults to the connection pool size)
+            **kwargs: Keyword arguments forwarded to :meth:`generate`
+            
+        Returns:
+            LLMResponse for each prompt, in input order
+        """
+        if model not in self.MODELS:
+            raise ValueError(f"Unsupported model: {model}. Supported: {list(self.MODELS.keys())}")
+        
+        semaphore = asyncio.Semaphore(max_concurrency or self.pool_maxsize)
+        
+        async def bounded_generate(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.generate_async(prompt, model=model, **kwargs)
+        
+        return list(await asyncio.gather(*(bounded_generate(p) for p in prompts)))
+    
+    async def extract_structured_data_async(self,
+                                            prompt: str,
+                                            expected_schema: Dict[str, Any],
+                                            **kwargs) -> LLMResponse:
+        """
+        Asynchronous variant of :meth:`extract_structured_data`.
+        
+        Args:
+            prompt: Input prompt for data extraction
+            expected_schema: Expected JSON schema for validation
+            **kwargs: Keyword arguments forwarded to :meth:`extract_structured_data`
+            
+        Returns:
+            LLMResponse with structured JSON data
+        """
+        return await asyncio.to_thread(
+            self.extract_structured_data, prompt, expected_schema, **kwargs
+        )
+    
     def check_health(self) -> bool:
         """
         Check if Ollama server is healthy and models are available.
         
+        The model inventory rarely changes, so a successful probe result is
+        reused for ``HEALTH_CACHE_TTL`` seconds. Failed probes are not cached,
+        so a newly pulled model or restarted server is seen on the next call.
+        
         Returns:
             True if server is healthy, False otherwise
         """
+        if self._health_cache is not None and time.monotonic() < self._health_cache[0]:
+            return self._health_cache[1]
+        
         try:
             # Check server health
             response = self.session.get(f"{self.base_url}/api/tags", timeout=10)
@@ -239,15 +560,17 @@ Response:"""
             
             # Check if required models are available
             models_data = response.json()
-            available_models = [model['name'] for model in models_data.get('models', [])]
+            available_models = {model['name'] for model in models_data.get('models', [])}
+            missing_models = set(self.MODELS.values()) - available_models
             
-            for model_key, model_name in self.MODELS.items():
-                if model_name not in available_models:
-                    logger.warning(f"Model {model_name} not found in Ollama")
-                    return False
+            for model_name in sorted(missing_models):
+                logger.warning(f"Model {model_name} not found in Ollama")
             
-            logger.info("Ollama server health check passed")
-            return True
+            healthy = not missing_models
+            if healthy:
+                self._health_cache = (time.monotonic() + self.HEALTH_CACHE_TTL, healthy)
+                logger.info("Ollama server health check passed")
+            return healthy
             
         except Exception as e:
             logger.error(f"Ollama health check failed: {str(e)}")
@@ -279,48 +602,4 @@ Response:"""
         Returns:
             Cleaned content ready for JSON parsing
         """
-        import re
-        
-        # Remove <think>...</think> blocks (case insensitive, multiline)
-        cleaned = re.sub(r'<think>.*?</think>', '', content, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove any other common LLM artifacts
-        cleaned = re.sub(r'<reasoning>.*?</reasoning>', '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        cleaned = re.sub(r'<analysis>.*?</analysis>', '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Clean up extra whitespace
-        cleaned = cleaned.strip()
-        
-        # If the response starts with "Response:" or similar, try to extract just the JSON part
-        if cleaned.lower().startswith('response:'):
-            cleaned = cleaned[9:].strip()
-        
-        return cleaned
-    
-    def _clean_llm_response(self, content: str) -> str:
-        """
-        Clean LLM response by removing <think>...</think> blocks and other artifacts.
-        
-        Args:
-            content: Raw LLM response content
-            
-        Returns:
-            Cleaned content ready for JSON parsing
-        """
-        import re
-        
-        # Remove <think>...</think> blocks (case insensitive, multiline)
-        cleaned = re.sub(r'<think>.*?</think>', '', content, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove any other common LLM artifacts
-        cleaned = re.sub(r'<reasoning>.*?</reasoning>', '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        cleaned = re.sub(r'<analysis>.*?</analysis>', '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Clean up extra whitespace
-        cleaned = cleaned.strip()
-        
-        # If the response starts with "Response:" or similar, try to extract just the JSON part
-        if cleaned.lower().startswith('response:'):
-            cleaned = cleaned[9:].strip()
-        
-        return cleaned
\ No newline at end of file
+        return _strip_llm_artifacts(content)
@@ -1,25 +1,238 @@
 """Prompt templates for structured data extraction."""
 
-from typing import Dict, Any
+import sys
+import textwrap
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypedDict, Union
 
 
-class PromptTemplates:
-    """Collection of prompt templates for different data extraction tasks."""
+# Templates, schemas and system prompts are built once at import time and
+# handed out as read-only views; treat the nested schema dicts as read-only too.
+#
+# Each template is split into a static prefix (instructions) followed by a
+# suffix carrying the per-call input, so every rendered prompt for a task
+# shares a byte-identical leading segment that provider prompt caches can reuse.
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces so static text can be embedded in a format string."""
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def _compile_renderer(prefix: str, suffix_template: str) -> Callable[..., str]:
+    """
+    Pre-split a template into literal segments once so rendering is a join.
     
-    @staticmethod
-    def compliance_report_extraction() -> Dict[str, Any]:
-        """
-        Template for extracting data from compliance reports.
+    Args:
+        prefix: Static leading text
+        suffix_template: Format string holding the input placeholders
         
-        Returns:
-            Dictionary with prompt template and expected schema
-        """
-        prompt_template = """
-Extract structured information from the following compliance report text.
-Focus on identifying requirements, their assessment status, rationale, and recommendations.
+    Returns:
+        Function rendering the prompt from the placeholder values, given
+        positionally in template order or by name
+    """
+    literals = [prefix]
+    field_names = []
+    for literal, field_name, _, _ in Formatter().parse(suffix_template):
+        literals[-1] += literal
+        if field_name is not None:
+            field_names.append(field_name)
+            literals.append('')
+    field_names = tuple(field_names)
+    
+    def render(*args: str, **kwargs: str) -> str:
+        values = dict(zip(field_names, args), **kwargs)
+        parts = [literals[0]]
+        for name, literal in zip(field_names, literals[1:]):
+            parts.append(str(values[name]))
+            parts.append(literal)
+        return ''.join(parts)
+    
+    render.field_names = field_names
+    render.literals = tuple(literals)
+    return render
 
-Compliance Report Text:
-{report_text}
+
+def _compile_batch_renderer(render: Callable[..., str]) -> Callable[[Iterable[Any]], List[str]]:
+    """
+    Build a renderer for many inputs on top of a compiled template renderer.
+    
+    Single-input templates are rendered by concatenating the pre-split head
+    and tail around each value, without a per-item function call.
+    
+    Args:
+        render: Renderer from ``_compile_renderer``
+        
+    Returns:
+        Function rendering a list of prompts; each input is the value itself
+        for single-input templates, or a mapping of placeholder values
+    """
+    if len(render.field_names) == 1:
+        field_name = render.field_names[0]
+        head, tail = render.literals
+        
+        def render_batch(inputs: Iterable[Union[str, Mapping[str, Any]]]) -> List[str]:
+            return [
+                head + (str(value[field_name]) if isinstance(value, Mapping) else str(value)) + tail
+                for value in inputs
+            ]
+    else:
+        def render_batch(inputs: Iterable[Mapping[str, Any]]) -> List[str]:
+            return [render(**values) for values in inputs]
+    
+    return render_batch
+
+
+# Python types accepted for the type names used in schema descriptions
+_SCHEMA_VALUE_TYPES = {
+    "string": ((str,), "string"),
+    "number": ((int, float), "number"),
+    "float": ((int, float), "number"),
+    "integer": ((int,), "integer"),
+    "boolean": ((bool,), "boolean"),
+}
+
+
+def _type_problem(path: str, expected: str, data: Any) -> str:
+    """Describe a JSON type mismatch at a path."""
+    if path:
+        return f"Expected key '{path}' to be a JSON {expected}"
+    return f"Expected a JSON {expected}, got {type(data).__name__}"
+
+
+def _compile_schema_node(node: Any) -> Callable[[Any, str, List[str]], None]:
+    """Compile one node of a schema description into a checking function."""
+    if isinstance(node, dict):
+        fields = tuple((key, _compile_schema_node(value)) for key, value in node.items())
+        
+        def check_object(data: Any, path: str, problems: List[str]):
+            if not isinstance(data, dict):
+                problems.append(_type_problem(path, "object", data))
+                return
+            for key, check_field in fields:
+                field_path = f"{path}.{key}" if path else key
+                if key not in data:
+                    problems.append(f"Missing expected key '{field_path}'")
+                else:
+                    check_field(data[key], field_path, problems)
+        
+        return check_object
+    
+    if isinstance(node, list):
+        check_item = _compile_schema_node(node[0]) if node else None
+        
+        def check_array(data: Any, path: str, problems: List[str]):
+            if not isinstance(data, list):
+                problems.append(_type_problem(path, "array", data))
+                return
+            if check_item is not None:
+                for index, item in enumerate(data):
+                    check_item(item, f"{path}[{index}]", problems)
+        
+        return check_array
+    
+    if isinstance(node, str) and node in _SCHEMA_VALUE_TYPES:
+        value_types, type_name = _SCHEMA_VALUE_TYPES[node]
+        accepts_bool = bool in value_types
+        
+        def check_value(data: Any, path: str, problems: List[str]):
+            if not isinstance(data, value_types) or (isinstance(data, bool) and not accepts_bool):
+                problems.append(_type_problem(path, type_name, data))
+        
+        return check_value
+    
+    # Unknown type names are not checked
+    return lambda data, path, problems: None
+
+
+def compile_schema_validator(schema: Any) -> Callable[[Any], List[str]]:
+    """
+    Compile a schema description into a validation function.
+    
+    Schema descriptions use example values: type names such as "string" or
+    "number", single-item lists for arrays and dicts for objects. The schema
+    is walked once here; the returned function only runs the prepared checks.
+    
+    Args:
+        schema: Schema description
+        
+    Returns:
+        Function returning the list of problems found in a decoded response
+        (empty when the response matches)
+    """
+    check = _compile_schema_node(schema)
+    
+    def validate(data: Any) -> List[str]:
+        problems: List[str] = []
+        check(data, "", problems)
+        return problems
+    
+    return validate
+
+
+def to_json_schema(schema: Any) -> Dict[str, Any]:
+    """
+    Convert a schema description into a JSON Schema document.
+    
+    Every key of a described object is marked as required, matching what
+    the compiled validators check.
+    
+    Args:
+        schema: Schema description using example values
+        
+    Returns:
+        Equivalent JSON Schema as a dict
+    """
+    if isinstance(schema, dict):
+        return {
+            "type": "object",
+            "properties": {key: to_json_schema(value) for key, value in schema.items()},
+            "required": list(schema)
+        }
+    if isinstance(schema, list):
+        return {"type": "array", "items": to_json_schema(schema[0])} if schema else {"type": "array"}
+    if isinstance(schema, str) and schema in _SCHEMA_VALUE_TYPES:
+        return {"type": _SCHEMA_VALUE_TYPES[schema][1]}
+    return {}
+
+
+def _template_entry(prefix: str, suffix_template: str, schema: Any,
+                    payload_type: type) -> Mapping[str, Any]:
+    """
+    Bundle a split template with its renderers and schema as a read-only mapping.
+    
+    Keys:
+        template: Full prompt template with its input placeholders
+        prefix: Static instruction text, identical across requests
+        suffix_template: Input section formatted with the request's text
+        render: Precompiled renderer for one input
+        render_batch: Renderer for a sequence of inputs
+        schema: Expected response schema description
+        json_schema: Schema converted to JSON Schema
+        payload_type: TypedDict describing the decoded response
+    """
+    # Trim the triple-quoted source text once here so no request carries
+    # stray indentation or blank lines; the prefix keeps a blank line as
+    # the separator from the input section.
+    prefix = textwrap.dedent(prefix).strip() + "\n\n"
+    suffix_template = textwrap.dedent(suffix_template).strip()
+    render = _compile_renderer(prefix, suffix_template)
+    return MappingProxyType({
+        "template": _escape_braces(prefix) + suffix_template,
+        "prefix": prefix,
+        "suffix_template": suffix_template,
+        "render": render,
+        "render_batch": _compile_batch_renderer(render),
+        "schema": schema,
+        "json_schema": to_json_schema(schema),
+        "payload_type": payload_type
+    })
+
+
+_COMPLIANCE_REPORT_PREFIX = """
+Extract structured information from the compliance report text given at the end.
+Focus on identifying requirements, their assessment status, rationale, and recommendations.
 
 Extract the following information for each requirement found:
 - requirement_number: The requirement identifier (e.g., R1, R2, etc.)
@@ -30,38 +243,48 @@ Extract the following information for each requirement found:
 
 If multiple requirements are present, extract all of them.
 """
-        
-        expected_schema = {
-            "requirements": [
-                {
-                    "requirement_number": "string",
-                    "requirement_text": "string", 
-                    "status": "string",
-                    "rationale": "string",
-                    "recommendation": "string"
-                }
-            ]
-        }
-        
-        return {
-            "template": prompt_template,
-            "schema": expected_schema
+
+_COMPLIANCE_REPORT_SUFFIX = """
+Compliance Report Text:
+{report_text}
+"""
+
+_COMPLIANCE_REPORT_SCHEMA = {
+    "requirements": [
+        {
+            "requirement_number": "string",
+            "requirement_text": "string", 
+            "status": "string",
+            "rationale": "string",
+            "recommendation": "string"
         }
-    
-    @staticmethod
-    def human_feedback_extraction() -> Dict[str, Any]:
-        """
-        Template for extracting data from human feedback text.
-        
-        Returns:
-            Dictionary with prompt template and expected schema
-        """
-        prompt_template = """
-Extract structured information from the following human expert feedback text.
-Focus on identifying the expert's decisions, rationale, and refined suggestions.
+    ]
+}
 
-Human Feedback Text:
-{feedback_text}
+
+class ComplianceRequirementPayload(TypedDict):
+    """One requirement in a compliance report extraction response."""
+    requirement_number: str
+    requirement_text: str
+    status: str
+    rationale: str
+    recommendation: str
+
+
+class ComplianceReportPayload(TypedDict):
+    """Response of the compliance report extraction prompt."""
+    requirements: List[ComplianceRequirementPayload]
+
+
+_COMPLIANCE_REPORT = _template_entry(
+    _COMPLIANCE_REPORT_PREFIX, _COMPLIANCE_REPORT_SUFFIX, _COMPLIANCE_REPORT_SCHEMA,
+    ComplianceReportPayload
+)
+
+
+_HUMAN_FEEDBACK_PREFIX = """
+Extract structured information from the human expert feedback text given at the end.
+Focus on identifying the expert's decisions, rationale, and refined suggestions.
 
 Extract the following information for each feedback item:
 - requirement_reference: Which requirement this feedback relates to (e.g., R1, R2, etc.)
@@ -72,86 +295,95 @@ Extract the following information for each feedback item:
 
 If multiple feedback items are present, extract all of them.
 """
-        
-        expected_schema = {
-            "feedback_items": [
-                {
-                    "requirement_reference": "string",
-                    "decision": "string",
-                    "rationale": "string", 
-                    "suggestion": "string",
-                    "confidence": "string"
-                }
-            ]
-        }
-        
-        return {
-            "template": prompt_template,
-            "schema": expected_schema
+
+_HUMAN_FEEDBACK_SUFFIX = """
+Human Feedback Text:
+{feedback_text}
+"""
+
+_HUMAN_FEEDBACK_SCHEMA = {
+    "feedback_items": [
+        {
+            "requirement_reference": "string",
+            "decision": "string",
+            "rationale": "string", 
+            "suggestion": "string",
+            "confidence": "string"
         }
-    
-    @staticmethod
-    def scenario_id_generation() -> Dict[str, Any]:
-        """
-        Template for generating scenario IDs from requirement text.
-        
-        Returns:
-            Dictionary with prompt template and expected schema
-        """
-        prompt_template = """
-Generate a unique scenario ID for the following requirement text.
-The ID should follow the format: {{domain}}_{{requirement_number}}_{{key_concept}}
+    ]
+}
+
+
+class FeedbackItemPayload(TypedDict):
+    """One feedback item in a human feedback extraction response."""
+    requirement_reference: str
+    decision: str
+    rationale: str
+    suggestion: str
+    confidence: str
+
+
+class HumanFeedbackPayload(TypedDict):
+    """Response of the human feedback extraction prompt."""
+    feedback_items: List[FeedbackItemPayload]
+
+
+_HUMAN_FEEDBACK = _template_entry(
+    _HUMAN_FEEDBACK_PREFIX, _HUMAN_FEEDBACK_SUFFIX, _HUMAN_FEEDBACK_SCHEMA,
+    HumanFeedbackPayload
+)
+
+
+_SCENARIO_ID_PREFIX = """
+Generate a unique scenario ID for the requirement given at the end.
+The ID should follow the format: {domain}_{requirement_number}_{key_concept}
 
 Where:
 - domain: The main domain/area (e.g., ecommerce, healthcare, finance)
 - requirement_number: The requirement identifier (e.g., r1, r2)
 - key_concept: A short, descriptive concept (e.g., consent, encryption, authentication)
 
-Requirement Text:
-{requirement_text}
-
-Requirement Number: {requirement_number}
-
 Generate a scenario ID that is:
 - Human-readable and descriptive
 - Uses lowercase with underscores
 - Captures the essence of the requirement
 - Unique and specific to this requirement
 """
-        
-        expected_schema = {
-            "scenario_id": "string",
-            "domain": "string",
-            "requirement_number": "string", 
-            "key_concept": "string",
-            "explanation": "string"
-        }
-        
-        return {
-            "template": prompt_template,
-            "schema": expected_schema
-        }
-    
-    @staticmethod
-    def ltm_rule_generation() -> Dict[str, Any]:
-        """
-        Template for generating LTM rules from human feedback.
-        
-        Returns:
-            Dictionary with prompt template and expected schema
-        """
-        prompt_template = """
-Analyze the following human expert feedback and generate a reusable compliance rule.
-The rule should be generalizable and applicable to similar situations.
 
-Original Requirement:
+_SCENARIO_ID_SUFFIX = """
+Requirement Text:
 {requirement_text}
 
-Initial Assessment:
-{initial_assessment}
+Requirement Number: {requirement_number}
+"""
 
-Human Expert Feedback:
-{human_feedback}
+_SCENARIO_ID_SCHEMA = {
+    "scenario_id": "string",
+    "domain": "string",
+    "requirement_number": "string", 
+    "key_concept": "string",
+    "explanation": "string"
+}
+
+
+class ScenarioIdPayload(TypedDict):
+    """Response of the scenario ID generation prompt."""
+    scenario_id: str
+    domain: str
+    requirement_number: str
+    key_concept: str
+    explanation: str
+
+
+_SCENARIO_ID = _template_entry(
+    _SCENARIO_ID_PREFIX, _SCENARIO_ID_SUFFIX, _SCENARIO_ID_SCHEMA,
+    ScenarioIdPayload
+)
+
+
+_LTM_RULE_PREFIX = """
+Analyze the human expert feedback given at the end and generate a reusable compliance rule.
+The rule should be generalizable and applicable to similar situations.
 
 Generate a Long-Term Memory rule that:
 - Captures the expert's knowledge in a reusable format
@@ -161,34 +393,45 @@ Generate a Long-Term Memory rule that:
 
 Extract related concepts that would help in future retrieval of this rule.
 """
-        
-        expected_schema = {
-            "rule_text": "string",
-            "related_concepts": ["string"],
-            "policy_area": "string",
-            "confidence_score": "number",
-            "applicability": "string"
-        }
-        
-        return {
-            "template": prompt_template,
-            "schema": expected_schema
-        }
-    
-    @staticmethod
-    def concept_extraction() -> Dict[str, Any]:
-        """
-        Template for extracting concepts from text for indexing.
-        
-        Returns:
-            Dictionary with prompt template and expected schema
-        """
-        prompt_template = """
-Extract key concepts from the following text for indexing and retrieval purposes.
-Focus on technical terms, compliance areas, and domain-specific concepts.
 
-Text:
-{text}
+_LTM_RULE_SUFFIX = """
+Original Requirement:
+{requirement_text}
+
+Initial Assessment:
+{initial_assessment}
+
+Human Expert Feedback:
+{human_feedback}
+"""
+
+_LTM_RULE_SCHEMA = {
+    "rule_text": "string",
+    "related_concepts": ["string"],
+    "policy_area": "string",
+    "confidence_score": "number",
+    "applicability": "string"
+}
+
+
+class LTMRulePayload(TypedDict):
+    """Response of the LTM rule generation prompt."""
+    rule_text: str
+    related_concepts: List[str]
+    policy_area: str
+    confidence_score: float
+    applicability: str
+
+
+_LTM_RULE = _template_entry(
+    _LTM_RULE_PREFIX, _LTM_RULE_SUFFIX, _LTM_RULE_SCHEMA,
+    LTMRulePayload
+)
+
+
+_CONCEPT_PREFIX = """
+Extract key concepts from the text given at the end for indexing and retrieval purposes.
+Focus on technical terms, compliance areas, and domain-specific concepts.
 
 Extract concepts that are:
 - Relevant for compliance and regulatory contexts
@@ -198,38 +441,191 @@ Extract concepts that are:
 
 Provide both the concepts and their categories (e.g., Technical, Legal, Domain, Process).
 """
-        
-        expected_schema = {
-            "concepts": [
-                {
-                    "term": "string",
-                    "category": "string",
-                    "relevance_score": "number"
-                }
-            ]
-        }
-        
-        return {
-            "template": prompt_template,
-            "schema": expected_schema
+
+_CONCEPT_SUFFIX = """
+Text:
+{text}
+"""
+
+_CONCEPT_SCHEMA = {
+    "concepts": [
+        {
+            "term": "string",
+            "category": "string",
+            "relevance_score": "number"
         }
+    ]
+}
+
+
+class ConceptPayload(TypedDict):
+    """One concept in a concept extraction response."""
+    term: str
+    category: str
+    relevance_score: float
+
+
+class ConceptExtractionPayload(TypedDict):
+    """Response of the concept extraction prompt."""
+    concepts: List[ConceptPayload]
+
+
+_CONCEPT = _template_entry(
+    _CONCEPT_PREFIX, _CONCEPT_SUFFIX, _CONCEPT_SCHEMA,
+    ConceptExtractionPayload
+)
+
+
+_JSON_TAIL = sys.intern(" Always respond with valid JSON.")
+
+
+def _system_prompt(role: str, task: str) -> str:
+    """Join a role and task description with the shared JSON instruction."""
+    return sys.intern(role + " " + task + _JSON_TAIL)
+
+
+_SYSTEM_PROMPTS = MappingProxyType({
+    "compliance_extraction": _system_prompt(
+        "You are a compliance analysis expert.",
+        "Extract structured information from compliance reports with high accuracy. Focus on identifying requirements, their status, and actionable recommendations."
+    ),
+    
+    "feedback_analysis": _system_prompt(
+        "You are an expert in analyzing human feedback on compliance assessments.",
+        "Extract the expert's decisions, reasoning, and suggestions in a structured format."
+    ),
+    
+    "id_generation": _system_prompt(
+        "You are a system architect responsible for generating meaningful, unique identifiers.",
+        "Create scenario IDs that are human-readable, descriptive, and follow the specified format."
+    ),
+    
+    "rule_generation": _system_prompt(
+        "You are a knowledge management expert specializing in compliance rules.",
+        "Generate reusable, generalizable rules from specific expert feedback. Focus on creating context-free rules that can apply broadly."
+    ),
+    
+    "concept_extraction": _system_prompt(
+        "You are a knowledge indexing specialist.",
+        "Extract relevant concepts from text for effective categorization and retrieval. Focus on compliance, technical, and domain-specific terms."
+    )
+})
+
+
+def compliance_report_extraction() -> Mapping[str, Any]:
+    """
+    Template for extracting data from compliance reports.
+    
+    Returns:
+        Read-only mapping with prompt template and expected schema
+    """
+    return _COMPLIANCE_REPORT
+
+
+def human_feedback_extraction() -> Mapping[str, Any]:
+    """
+    Template for extracting data from human feedback text.
+    
+    Returns:
+        Read-only mapping with prompt template and expected schema
+    """
+    return _HUMAN_FEEDBACK
+
+
+def scenario_id_generation() -> Mapping[str, Any]:
+    """
+    Template for generating scenario IDs from requirement text.
+    
+    Returns:
+        Read-only mapping with prompt template and expected schema
+    """
+    return _SCENARIO_ID
+
+
+def ltm_rule_generation() -> Mapping[str, Any]:
+    """
+    Template for generating LTM rules from human feedback.
+    
+    Returns:
+        Read-only mapping with prompt template and expected schema
+    """
+    return _LTM_RULE
+
+
+def concept_extraction() -> Mapping[str, Any]:
+    """
+    Template for extracting concepts from text for indexing.
+    
+    Returns:
+        Read-only mapping with prompt template and expected schema
+    """
+    return _CONCEPT
+
+
+def get_system_prompts() -> Mapping[str, str]:
+    """
+    Get system prompts for different extraction tasks.
+    
+    Returns:
+        Read-only mapping of task names to system prompts
+    """
+    return _SYSTEM_PROMPTS
+
+
+TEMPLATES: Mapping[str, Callable[[], Mapping[str, Any]]] = MappingProxyType({
+    "compliance_report_extraction": compliance_report_extraction,
+    "human_feedback_extraction": human_feedback_extraction,
+    "scenario_id_generation": scenario_id_generation,
+    "ltm_rule_generation": ltm_rule_generation,
+    "concept_extraction": concept_extraction
+})
+
+# Token ids of each template's static segments, filled by precompute_token_prefixes()
+_PREFIX_TOKEN_CACHE: Dict[str, Tuple[Tuple[int, ...], ...]] = {}
+
+
+def precompute_token_prefixes(tokenizer: Any) -> None:
+    """
+    Tokenize the static segments of every template once and cache the ids.
+    
+    Callers that tokenize prompts locally can then build the ids for a
+    rendered prompt by interleaving the cached segments with the tokens of
+    the inputs instead of tokenizing the full prompt on every call.
+    
+    Args:
+        tokenizer: Object with an ``encode(text, add_special_tokens=False)``
+            method returning a sequence of token ids
+    """
+    for name, template in TEMPLATES.items():
+        _PREFIX_TOKEN_CACHE[name] = tuple(
+            tuple(int(token_id) for token_id in tokenizer.encode(literal, add_special_tokens=False))
+            for literal in template()["render"].literals
+        )
+
+
+def get_cached_token_segments(name: str) -> Optional[Tuple[Tuple[int, ...], ...]]:
+    """
+    Get the cached token ids for a template's static segments.
     
-    @staticmethod
-    def get_system_prompts() -> Dict[str, str]:
-        """
-        Get system prompts for different extraction tasks.
+    Args:
+        name: Template name, e.g. ``"compliance_report_extraction"``
         
-        Returns:
-            Dictionary mapping task names to system prompts
-        """
-        return {
-            "compliance_extraction": """You are a compliance analysis expert. Extract structured information from compliance reports with high accuracy. Focus on identifying requirements, their status, and actionable recommendations. Always respond with valid JSON.""",
-            
-            "feedback_analysis": """You are an expert in analyzing human feedback on compliance assessments. Extract the expert's decisions, reasoning, and suggestions in a structured format. Always respond with valid JSON.""",
-            
-            "id_generation": """You are a system architect responsible for generating meaningful, unique identifiers. Create scenario IDs that are human-readable, descriptive, and follow the specified format. Always respond with valid JSON.""",
-            
-            "rule_generation": """You are a knowledge management expert specializing in compliance rules. Generate reusable, generalizable rules from specific expert feedback. Focus on creating context-free rules that can apply broadly. Always respond with valid JSON.""",
-            
-            "concept_extraction": """You are a knowledge indexing specialist. Extract relevant concepts from text for effective categorization and retrieval. Focus on compliance, technical, and domain-specific terms. Always respond with valid JSON."""
-        }
\ No newline at end of file
+    Returns:
+        Token ids of the static text before, between and after the input
+        placeholders (``(prefix_ids, suffix_ids)`` for single-input
+        templates), or None if precompute_token_prefixes() has not run
+    """
+    return _PREFIX_TOKEN_CACHE.get(name)
+
+
+class PromptTemplates:
+    """Collection of prompt templates for different data extraction tasks."""
+    
+    # Namespace over the module-level functions for existing callers; look
+    # templates up by name in TEMPLATES instead of getattr on this class.
+    compliance_report_extraction = staticmethod(compliance_report_extraction)
+    human_feedback_extraction = staticmethod(human_feedback_extraction)
+    scenario_id_generation = staticmethod(scenario_id_generation)
+    ltm_rule_generation = staticmethod(ltm_rule_generation)
+    concept_extraction = staticmethod(concept_extraction)
+    get_system_prompts = staticmethod(get_system_prompts)
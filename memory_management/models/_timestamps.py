@@ -0,0 +1,18 @@
+"""
+Timestamp helpers shared by the memory data models.
+"""
+
+from datetime import datetime, timezone
+
+
+def utc_timestamp() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with a 'Z' suffix.
+    
+    Callers creating many objects at once can take one timestamp and pass it
+    as ``created_at``/``updated_at`` instead of having each object read the clock.
+    
+    Returns:
+        str: Timestamp such as ``2024-01-01T12:00:00.123456Z``
+    """
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
@@ -4,15 +4,14 @@ Long-Term Memory (LTM) Rule data model.
 Represents generalizable knowledge rules extracted from expert feedback.
 """
 
-import json
-from datetime import datetime
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
-from dataclasses_json import dataclass_json
+from dataclasses import dataclass
 
+from .. import _jsonlib
+from ._timestamps import utc_timestamp
 
-@dataclass_json
-@dataclass
+
+@dataclass(slots=True)
 class LTMRule:
     """
     Long-Term Memory rule representing generalizable compliance knowledge.
@@ -31,11 +30,12 @@ class LTMRule:
     
     def __post_init__(self):
         """Set timestamps if not provided."""
-        current_time = datetime.utcnow().isoformat() + 'Z'
-        if self.created_at is None:
-            self.created_at = current_time
-        if self.updated_at is None:
-            self.updated_at = current_time
+        if self.created_at is None or self.updated_at is None:
+            current_time = utc_timestamp()
+            if self.created_at is None:
+                self.created_at = current_time
+            if self.updated_at is None:
+                self.updated_at = current_time
     
     def validate(self) -> bool:
         """
@@ -48,12 +48,12 @@ class LTMRule:
         if not self.rule_id or not self.rule_id.strip():
             return False
         
-        if not self.rule_text or not self.rule_text.strip():
+        # Validate rule_id format: {policy}_{concept}_{version}
+        # (at least three underscore-separated parts, without splitting)
+        if self.rule_id.count('_') < 2:
             return False
         
-        # Validate rule_id format: {policy}_{concept}_{version}
-        parts = self.rule_id.split('_')
-        if len(parts) < 3:
+        if not self.rule_text or not self.rule_text.strip():
             return False
         
         # Check that related_concepts is not empty
@@ -81,7 +81,7 @@ class LTMRule:
         Returns:
             str: JSON representation of the LTM rule
         """
-        return self.to_json()
+        return _jsonlib.dumps(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'LTMRule':
@@ -94,7 +94,7 @@ class LTMRule:
         Returns:
             LTMRule: Deserialized LTM rule object
         """
-        return cls.from_json(json_str)
+        return cls.from_dict(_jsonlib.loads(json_str))
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -103,7 +103,18 @@ class LTMRule:
         Returns:
             Dict: Dictionary representation of the LTM rule
         """
-        return asdict(self)
+        # Built field by field rather than with asdict(), which deep-copies
+        # recursively; the lists are still copied so callers own the result
+        return {
+            'rule_id': self.rule_id,
+            'rule_text': self.rule_text,
+            'related_concepts': list(self.related_concepts),
+            'source_scenario_id': list(self.source_scenario_id),
+            'confidence_score': self.confidence_score,
+            'version': self.version,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LTMRule':
@@ -120,7 +131,7 @@ class LTMRule:
     
     def update_timestamp(self):
         """Update the updated_at timestamp to current time."""
-        self.updated_at = datetime.utcnow().isoformat() + 'Z'
+        self.updated_at = utc_timestamp()
     
     def add_source_scenario(self, scenario_id: str):
         """
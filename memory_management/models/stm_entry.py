@@ -4,14 +4,13 @@ Short-Term Memory (STM) Entry data model.
 Represents detailed case files from compliance assessment interactions.
 """
 
-import json
-from datetime import datetime
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from dataclasses_json import dataclass_json
+from dataclasses import dataclass
+
+from .. import _jsonlib
+from ._timestamps import utc_timestamp
 
 
-@dataclass_json
 @dataclass
 class InitialAssessment:
     """Initial assessment data from RA_Agent."""
@@ -21,14 +20,13 @@ class InitialAssessment:
     
     def validate(self) -> bool:
         """Validate the initial assessment data."""
-        required_fields = ['status', 'rationale', 'recommendation']
-        for field in required_fields:
-            if not getattr(self, field) or not getattr(self, field).strip():
-                return False
-        return True
+        return bool(
+            self.status and self.status.strip()
+            and self.rationale and self.rationale.strip()
+            and self.recommendation and self.recommendation.strip()
+        )
 
 
-@dataclass_json
 @dataclass
 class HumanFeedback:
     """Human expert feedback data."""
@@ -38,14 +36,13 @@ class HumanFeedback:
     
     def validate(self) -> bool:
         """Validate the human feedback data."""
-        required_fields = ['decision', 'rationale', 'suggestion']
-        for field in required_fields:
-            if not getattr(self, field) or not getattr(self, field).strip():
-                return False
-        return True
+        return bool(
+            self.decision and self.decision.strip()
+            and self.rationale and self.rationale.strip()
+            and self.suggestion and self.suggestion.strip()
+        )
 
 
-@dataclass_json
 @dataclass
 class STMEntry:
     """
@@ -64,11 +61,12 @@ class STMEntry:
     
     def __post_init__(self):
         """Set timestamps if not provided."""
-        current_time = datetime.utcnow().isoformat() + 'Z'
-        if self.created_at is None:
-            self.created_at = current_time
-        if self.updated_at is None:
-            self.updated_at = current_time
+        if self.created_at is None or self.updated_at is None:
+            current_time = utc_timestamp()
+            if self.created_at is None:
+                self.created_at = current_time
+            if self.updated_at is None:
+                self.updated_at = current_time
     
     def validate(self) -> bool:
         """
@@ -78,10 +76,10 @@ class STMEntry:
             bool: True if all required fields are present and valid
         """
         # Check required string fields
-        required_fields = ['scenario_id', 'requirement_text', 'final_status']
-        for field in required_fields:
-            if not getattr(self, field) or not getattr(self, field).strip():
-                return False
+        if not (self.scenario_id and self.scenario_id.strip()
+                and self.requirement_text and self.requirement_text.strip()
+                and self.final_status and self.final_status.strip()):
+            return False
         
         # Validate nested objects
         if not self.initial_assessment.validate():
@@ -91,8 +89,8 @@ class STMEntry:
             return False
         
         # Validate scenario_id format: {domain}_{requirement_number}_{key_concept}
-        parts = self.scenario_id.split('_')
-        if len(parts) < 3:
+        # (at least three underscore-separated parts, without splitting)
+        if self.scenario_id.count('_') < 2:
             return False
         
         return True
@@ -104,7 +102,18 @@ class STMEntry:
         Returns:
             str: JSON representation of the STM entry
         """
-        return self.to_json()
+        return _jsonlib.dumps(self.to_dict())
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize STM entry to UTF-8 encoded JSON bytes.
+        
+        For writing straight to files or sockets without building a str first.
+        
+        Returns:
+            bytes: Compact JSON representation of the STM entry
+        """
+        return _jsonlib.dumps_bytes(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'STMEntry':
@@ -117,7 +126,7 @@ class STMEntry:
         Returns:
             STMEntry: Deserialized STM entry object
         """
-        return cls.from_json(json_str)
+        return cls.from_dict(_jsonlib.loads(json_str))
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -126,7 +135,27 @@ class STMEntry:
         Returns:
             Dict: Dictionary representation of the STM entry
         """
-        return asdict(self)
+        # Built field by field rather than with asdict(), which deep-copies
+        # recursively; all leaf values are immutable strings
+        initial_assessment = self.initial_assessment
+        human_feedback = self.human_feedback
+        return {
+            'scenario_id': self.scenario_id,
+            'requirement_text': self.requirement_text,
+            'initial_assessment': None if initial_assessment is None else {
+                'status': initial_assessment.status,
+                'rationale': initial_assessment.rationale,
+                'recommendation': initial_assessment.recommendation
+            },
+            'human_feedback': None if human_feedback is None else {
+                'decision': human_feedback.decision,
+                'rationale': human_feedback.rationale,
+                'suggestion': human_feedback.suggestion
+            },
+            'final_status': self.final_status,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'STMEntry':
@@ -139,15 +168,25 @@ class STMEntry:
         Returns:
             STMEntry: STM entry object
         """
-        # Convert nested dictionaries to dataclass objects
-        if 'initial_assessment' in data and isinstance(data['initial_assessment'], dict):
-            data['initial_assessment'] = InitialAssessment(**data['initial_assessment'])
+        # Convert nested dictionaries to dataclass objects without modifying `data`
+        initial_assessment = data['initial_assessment']
+        if isinstance(initial_assessment, dict):
+            initial_assessment = InitialAssessment(**initial_assessment)
         
-        if 'human_feedback' in data and isinstance(data['human_feedback'], dict):
-            data['human_feedback'] = HumanFeedback(**data['human_feedback'])
+        human_feedback = data['human_feedback']
+        if isinstance(human_feedback, dict):
+            human_feedback = HumanFeedback(**human_feedback)
         
-        return cls(**data)
+        return cls(
+            scenario_id=data['scenario_id'],
+            requirement_text=data['requirement_text'],
+            initial_assessment=initial_assessment,
+            human_feedback=human_feedback,
+            final_status=data['final_status'],
+            created_at=data.get('created_at'),
+            updated_at=data.get('updated_at')
+        )
     
     def update_timestamp(self):
         """Update the updated_at timestamp to current time."""
-        self.updated_at = datetime.utcnow().isoformat() + 'Z'
\ No newline at end of file
+        self.updated_at = utc_timestamp()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Input and field helpers shared by the parsers.
+"""
+
+import mmap
+import os
+from typing import IO, Any, Dict, Union
+
+# A filesystem path or an already open text or binary file object
+TextSource = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+
+def _read_mapped(path: Union[str, os.PathLike]) -> str:
+    """Decode a file straight from a read-only memory map of its contents."""
+    with open(path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and non-regular files such as pipes cannot be mapped
+            text = file.read().decode('utf-8')
+        else:
+            with mapped:
+                text = str(mapped, 'utf-8')
+    
+    # Match the universal newline handling of text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_text(source: TextSource, memory_map: bool = False) -> str:
+    """
+    Read the full text of a file path or file-like object.
+    
+    Binary content is decoded as UTF-8. File objects are read as-is and
+    are not closed.
+    
+    Args:
+        source: Path to a file, or an open file object (e.g. io.StringIO)
+        memory_map: Decode paths directly from a memory map instead of
+            reading them into an intermediate bytes buffer; worthwhile for
+            large files
+        
+    Returns:
+        str: Text content
+        
+    Raises:
+        FileNotFoundError: If a path does not exist
+    """
+    if hasattr(source, 'read'):
+        content = source.read()
+    elif memory_map:
+        return _read_mapped(source)
+    else:
+        with open(source, 'r', encoding='utf-8') as file:
+            return file.read()
+    
+    if isinstance(content, bytes):
+        return content.decode('utf-8')
+    return content
+
+
+def _text_field(data: Dict[str, Any], key: str) -> str:
+    """
+    Read a field from LLM output as stripped text.
+    
+    Values decoded from JSON are almost always strings already, so they are
+    stripped directly; other values are converted with str() first and
+    missing or null values become an empty string.
+    
+    Args:
+        data: Object decoded from the LLM response
+        key: Field name
+        
+    Returns:
+        Stripped field text
+    """
+    value = data.get(key)
+    if isinstance(value, str):
+        return value.strip()
+    if value is None:
+        return ''
+    return str(value).strip()
@@ -1,16 +1,45 @@
 """LLM-based compliance report parser for extracting structured data."""
 
+import asyncio
 import json
 import logging
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from .. import _jsonlib
 from ..llm.client import LLMClient, LLMResponse
 from ..llm.prompts import PromptTemplates
+from ._io import TextSource, _text_field, read_text
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _status_count_key(status: str) -> str:
+    """
+    Classify a requirement status into its validation statistics counter.
+    
+    Statuses come from a small vocabulary, so results are cached and each
+    distinct status string is only classified once.
+    
+    Args:
+        status: Requirement status as reported
+        
+    Returns:
+        Name of the statistics counter for the status
+    """
+    status_lower = status.lower()
+    if 'compliant' in status_lower and 'non' not in status_lower and 'partial' not in status_lower:
+        return 'compliant_count'
+    if 'non-compliant' in status_lower or 'non compliant' in status_lower:
+        return 'non_compliant_count'
+    if 'partial' in status_lower:
+        return 'partially_compliant_count'
+    return 'other_status_count'
+
+
 @dataclass
 class ComplianceRequirement:
     """Structured representation of a compliance requirement."""
@@ -52,31 +81,48 @@ class ParsedComplianceReport:
 class ComplianceReportParser:
     """LLM-based parser for compliance reports."""
     
-    def __init__(self, llm_client: Optional[LLMClient] = None, model: str = 'qwq:32b'):
+    # Concurrent parses in parse_report_batch when the client has no pool size
+    DEFAULT_BATCH_CONCURRENCY = 8
+    
+    def __init__(self, llm_client: Optional[LLMClient] = None, model: str = 'qwq:32b',
+                 keep_raw_text: bool = False):
         """
         Initialize the compliance report parser.
         
         Args:
             llm_client: Optional LLM client instance
             model: Model to use for parsing
+            keep_raw_text: Keep the report text on successfully parsed reports;
+                failed parses always keep it for diagnosis
         """
         self.llm_client = llm_client or LLMClient()
         self.model = model
+        self.keep_raw_text = keep_raw_text
         self.prompt_templates = PromptTemplates()
+        
+        # The instructions and schema are sent as an identical prompt prefix
+        # on every call with only the report text appended after them, so
+        # the LLM server can reuse its cache for the shared prefix
+        template_data = self.prompt_templates.compliance_report_extraction()
+        self._prompt_prefix = template_data["prefix"].rstrip()
+        self._input_template = template_data["suffix_template"]
+        self._schema = template_data["schema"]
+        self._system_prompt = self.prompt_templates.get_system_prompts()["compliance_extraction"]
     
-    def parse_report_file(self, file_path: str) -> ParsedComplianceReport:
+    def parse_report_file(self, file_path: TextSource) -> ParsedComplianceReport:
         """
         Parse a compliance report from a file.
         
         Args:
-            file_path: Path to the compliance report file
+            file_path: Path to the compliance report file, or an open text or
+                binary file object (e.g. io.StringIO) to parse without
+                touching the filesystem
             
         Returns:
             ParsedComplianceReport with extracted data
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                report_text = file.read()
+            report_text = read_text(file_path, memory_map=True)
             
             return self.parse_report_text(report_text)
             
@@ -116,19 +162,14 @@ class ComplianceReportParser:
             )
         
         try:
-            # Get prompt template and schema
-            template_data = self.prompt_templates.compliance_report_extraction()
-            prompt = template_data["template"].format(report_text=report_text)
-            schema = template_data["schema"]
-            system_prompt = self.prompt_templates.get_system_prompts()["compliance_extraction"]
-            
             # Extract structured data using LLM
             logger.info("Extracting compliance requirements using LLM")
             response = self.llm_client.extract_structured_data(
-                prompt=prompt,
-                expected_schema=schema,
+                prompt=self._prompt_prefix,
+                expected_schema=self._schema,
                 model=self.model,
-                system_prompt=system_prompt
+                system_prompt=self._system_prompt,
+                input_text=self._input_template.format(report_text=report_text)
             )
             
             if not response.success:
@@ -140,15 +181,17 @@ class ComplianceReportParser:
                     error_message=f"LLM extraction failed: {response.error}"
                 )
             
-            # Parse the JSON response
+            # Parse the JSON response, reusing the client's decoded copy when present
             try:
-                parsed_data = json.loads(response.content)
+                parsed_data = response.parsed
+                if parsed_data is None:
+                    parsed_data = _jsonlib.loads(response.content)
                 requirements = self._convert_to_requirements(parsed_data.get('requirements', []))
                 
                 logger.info(f"Successfully parsed {len(requirements)} requirements")
                 return ParsedComplianceReport(
                     requirements=requirements,
-                    raw_text=report_text,
+                    raw_text=report_text if self.keep_raw_text else "",
                     parsing_success=True
                 )
                 
@@ -170,6 +213,33 @@ class ComplianceReportParser:
                 error_message=f"Parsing error: {str(e)}"
             )
     
+    async def parse_report_batch(self,
+                                 report_texts: List[str],
+                                 max_concurrency: Optional[int] = None) -> List[ParsedComplianceReport]:
+        """
+        Parse several compliance reports concurrently.
+        
+        Each report is parsed with :meth:`parse_report_text` in a worker thread,
+        so the LLM round-trips overlap and share the client's pooled session.
+        
+        Args:
+            report_texts: Raw compliance report texts
+            max_concurrency: Maximum number of reports parsed at once
+                (defaults to the client's connection pool size)
+            
+        Returns:
+            ParsedComplianceReport for each text, in input order
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(self.llm_client, 'pool_maxsize', None) or self.DEFAULT_BATCH_CONCURRENCY
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_parse(report_text: str) -> ParsedComplianceReport:
+            async with semaphore:
+                return await asyncio.to_thread(self.parse_report_text, report_text)
+        
+        return list(await asyncio.gather(*(bounded_parse(text) for text in report_texts)))
+    
     def _convert_to_requirements(self, requirements_data: List[Dict[str, Any]]) -> List[ComplianceRequirement]:
         """
         Convert parsed JSON data to ComplianceRequirement objects.
@@ -185,11 +255,11 @@ class ComplianceReportParser:
         for req_data in requirements_data:
             try:
                 requirement = ComplianceRequirement(
-                    requirement_number=str(req_data.get('requirement_number', '')).strip(),
-                    requirement_text=str(req_data.get('requirement_text', '')).strip(),
-                    status=str(req_data.get('status', '')).strip(),
-                    rationale=str(req_data.get('rationale', '')).strip(),
-                    recommendation=str(req_data.get('recommendation', '')).strip()
+                    requirement_number=_text_field(req_data, 'requirement_number'),
+                    requirement_text=_text_field(req_data, 'requirement_text'),
+                    status=_text_field(req_data, 'status'),
+                    rationale=_text_field(req_data, 'rationale'),
+                    recommendation=_text_field(req_data, 'recommendation')
                 )
                 
                 # Validate that required fields are not empty
@@ -238,8 +308,10 @@ class ComplianceReportParser:
             validation_results['errors'].append("No requirements found in the report")
             return validation_results
         
-        # Validate individual requirements
+        # Validate individual requirements, counting requirement numbers in the same pass
+        number_counts = Counter()
         for i, req in enumerate(parsed_report.requirements):
+            number_counts[req.requirement_number] += 1
             req_errors = []
             
             # Check required fields
@@ -253,25 +325,16 @@ class ComplianceReportParser:
                 req_errors.append("Missing rationale")
             
             # Count status types
-            status_lower = req.status.lower()
-            if 'compliant' in status_lower and 'non' not in status_lower and 'partial' not in status_lower:
-                validation_results['statistics']['compliant_count'] += 1
-            elif 'non-compliant' in status_lower or 'non compliant' in status_lower:
-                validation_results['statistics']['non_compliant_count'] += 1
-            elif 'partial' in status_lower:
-                validation_results['statistics']['partially_compliant_count'] += 1
-            else:
-                validation_results['statistics']['other_status_count'] += 1
+            validation_results['statistics'][_status_count_key(req.status)] += 1
             
             if req_errors:
                 validation_results['errors'].extend([f"Requirement {req.requirement_number}: {error}" for error in req_errors])
                 validation_results['is_valid'] = False
         
         # Check for duplicate requirement numbers
-        req_numbers = [req.requirement_number for req in parsed_report.requirements]
-        duplicates = set([num for num in req_numbers if req_numbers.count(num) > 1])
+        duplicates = [num for num, count in number_counts.items() if count > 1]
         if duplicates:
-            validation_results['warnings'].append(f"Duplicate requirement numbers found: {list(duplicates)}")
+            validation_results['warnings'].append(f"Duplicate requirement numbers found: {duplicates}")
         
         return validation_results
     
@@ -309,15 +372,23 @@ class ComplianceReportParser:
                 'total_requirements': 0
             }
         
+        requirements = parsed_report.requirements
+        
+        # Gather all statistics in a single pass over the requirements
         status_counts = {}
-        for req in parsed_report.requirements:
+        recommendation_count = 0
+        total_text_length = 0
+        for req in requirements:
             status = req.status
             status_counts[status] = status_counts.get(status, 0) + 1
+            if req.recommendation.strip():
+                recommendation_count += 1
+            total_text_length += len(req.requirement_text)
         
         return {
             'parsing_success': True,
-            'total_requirements': len(parsed_report.requirements),
+            'total_requirements': len(requirements),
             'status_distribution': status_counts,
-            'has_recommendations': sum(1 for req in parsed_report.requirements if req.recommendation.strip()),
-            'average_text_length': sum(len(req.requirement_text) for req in parsed_report.requirements) / len(parsed_report.requirements) if parsed_report.requirements else 0
+            'has_recommendations': recommendation_count,
+            'average_text_length': total_text_length / len(requirements) if requirements else 0
         }
\ No newline at end of file
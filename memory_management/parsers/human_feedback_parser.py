@@ -1,17 +1,120 @@
 """LLM-based human feedback parser for extracting structured data."""
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Any, Mapping, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, replace
 
+from .. import _jsonlib
 from ..llm.client import LLMClient, LLMResponse
 from ..llm.prompts import PromptTemplates
+from ._io import TextSource, _text_field, read_text
+from .compliance_report_parser import ComplianceRequirement
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
 
-@dataclass
+# A requirement reference such as "R2" or "r2"
+_REFERENCE_RE = re.compile(r'R\d+', re.IGNORECASE)
+
+_REFERENCE_SYSTEM_PROMPT = "You are an expert at matching feedback to requirements. Identify which requirement a feedback item refers to based on context clues."
+
+# Response structure for matching several feedback items in one request
+_REFERENCE_BATCH_SCHEMA = {
+    "mappings": [
+        {
+            "item": "number",
+            "requirement_number": "string"
+        }
+    ]
+}
+
+# Requirements given as dictionaries or as objects with the same attributes
+RequirementLike = Union[Mapping[str, Any], ComplianceRequirement]
+
+
+def _requirement_field(requirement: RequirementLike, name: str) -> Any:
+    """Read a field from a requirement dictionary or requirement object."""
+    if isinstance(requirement, Mapping):
+        return requirement[name]
+    return getattr(requirement, name)
+
+
+def _item_number(value: Any) -> Optional[int]:
+    """Coerce an item number given as an int, integral float or digit string."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+# Decision categories and the validation statistics counter for each
+DECISION_CATEGORIES = ('accept', 'reject', 'modify', 'other')
+_DECISION_COUNT_KEYS = {
+    'accept': 'accept_count',
+    'reject': 'reject_count',
+    'modify': 'modify_count',
+    'other': 'other_decision_count'
+}
+
+
+@lru_cache(maxsize=256)
+def _decision_category(decision: str) -> str:
+    """
+    Classify a feedback decision into one of DECISION_CATEGORIES.
+    
+    Decisions repeat across feedback items, so results are cached and each
+    distinct decision string is only classified once.
+    
+    Args:
+        decision: Decision as given by the expert
+        
+    Returns:
+        Decision category
+    """
+    decision_lower = decision.lower()
+    if 'accept' in decision_lower or 'no change' in decision_lower:
+        return 'accept'
+    if 'reject' in decision_lower:
+        return 'reject'
+    if 'modify' in decision_lower or 'change' in decision_lower:
+        return 'modify'
+    return 'other'
+
+
+@lru_cache(maxsize=64)
+def _render_requirements(requirements: Tuple[Tuple[str, str], ...]) -> str:
+    """Render (number, text) pairs as the requirements block of a reference-matching prompt."""
+    return "\n\n".join([f"Requirement {number}: {text}" for number, text in requirements])
+
+
+def _format_requirements(compliance_requirements: Sequence[RequirementLike]) -> str:
+    """
+    List requirements by number and text for a reference-matching prompt.
+    
+    The same requirements are matched against many feedback items, so the
+    rendered block is cached by requirement numbers and texts.
+    """
+    return _render_requirements(tuple([
+        (_requirement_field(req, 'requirement_number'), _requirement_field(req, 'requirement_text'))
+        for req in compliance_requirements
+    ]))
+
+
+@dataclass(slots=True)
 class FeedbackItem:
     """Structured representation of a human feedback item."""
     requirement_reference: str
@@ -20,6 +123,11 @@ class FeedbackItem:
     suggestion: str
     confidence: str = ""
     
+    @property
+    def category(self) -> str:
+        """Decision category (one of DECISION_CATEGORIES), classified once per distinct decision."""
+        return _decision_category(self.decision)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
         return {
@@ -31,7 +139,7 @@ class FeedbackItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedHumanFeedback:
     """Container for parsed human feedback data."""
     feedback_items: List[FeedbackItem]
@@ -47,36 +155,73 @@ class ParsedHumanFeedback:
             'parsing_success': self.parsing_success,
             'error_message': self.error_message
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to UTF-8 encoded JSON with the same structure as to_dict.
+        
+        The dataclasses are encoded directly, without building the
+        intermediate dictionaries of to_dict first.
+        """
+        return _jsonlib.dumps_bytes(self)
+    
+    def write_json(self, path: Union[str, os.PathLike]):
+        """Write the JSON form of the parsed feedback to a file."""
+        with open(path, 'wb') as file:
+            file.write(self.to_json_bytes())
 
 
 class HumanFeedbackParser:
     """LLM-based parser for human expert feedback."""
     
-    def __init__(self, llm_client: Optional[LLMClient] = None, model: str = 'qwq:32b'):
+    # Concurrent parses in batch methods when the client has no pool size
+    DEFAULT_BATCH_CONCURRENCY = 8
+    
+    def __init__(self, llm_client: Optional[LLMClient] = None, model: str = 'qwq:32b',
+                 cache_size: int = 256):
         """
         Initialize the human feedback parser.
         
         Args:
             llm_client: Optional LLM client instance
             model: Model to use for parsing
+            cache_size: Maximum number of successfully parsed feedback texts,
+                and of requirement reference matches, kept for reuse
+                (0 disables caching)
         """
         self.llm_client = llm_client or LLMClient()
         self.model = model
+        self.cache_size = cache_size
+        self._result_cache: "OrderedDict[str, Tuple[FeedbackItem, ...]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # Unclear references repeat across runs over the same feedback, so LLM
+        # matches are memoized per parser by item text and requirements list
+        self._cached_reference = lru_cache(maxsize=cache_size)(self._match_requirement_reference)
         self.prompt_templates = PromptTemplates()
+        
+        # The instructions and schema are sent as an identical prompt prefix
+        # on every call with only the feedback text appended after them, so
+        # the LLM server can reuse its cache for the shared prefix
+        template_data = self.prompt_templates.human_feedback_extraction()
+        self._prompt_prefix = template_data["prefix"].rstrip()
+        self._input_template = template_data["suffix_template"]
+        self._schema = template_data["schema"]
+        self._system_prompt = self.prompt_templates.get_system_prompts()["feedback_analysis"]
     
-    def parse_feedback_file(self, file_path: str) -> ParsedHumanFeedback:
+    def parse_feedback_file(self, file_path: TextSource) -> ParsedHumanFeedback:
         """
         Parse human feedback from a file.
         
         Args:
-            file_path: Path to the human feedback file
+            file_path: Path to the human feedback file, or an open text or
+                binary file object (e.g. io.StringIO) to parse without
+                touching the filesystem
             
         Returns:
             ParsedHumanFeedback with extracted data
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                feedback_text = file.read()
+            feedback_text = read_text(file_path, memory_map=True)
             
             return self.parse_feedback_text(feedback_text)
             
@@ -115,20 +260,27 @@ class HumanFeedbackParser:
                 error_message="Empty feedback text provided"
             )
         
+        cache_key = None
+        if self.cache_size > 0:
+            cache_key = self._result_cache_key(feedback_text)
+            cached_items = self._get_cached_items(cache_key)
+            if cached_items is not None:
+                logger.debug("Using cached parse for repeated feedback text")
+                return ParsedHumanFeedback(
+                    feedback_items=[replace(item) for item in cached_items],
+                    raw_text=feedback_text,
+                    parsing_success=True
+                )
+        
         try:
-            # Get prompt template and schema
-            template_data = self.prompt_templates.human_feedback_extraction()
-            prompt = template_data["template"].format(feedback_text=feedback_text)
-            schema = template_data["schema"]
-            system_prompt = self.prompt_templates.get_system_prompts()["feedback_analysis"]
-            
             # Extract structured data using LLM
             logger.info("Extracting human feedback items using LLM")
             response = self.llm_client.extract_structured_data(
-                prompt=prompt,
-                expected_schema=schema,
+                prompt=self._prompt_prefix,
+                expected_schema=self._schema,
                 model=self.model,
-                system_prompt=system_prompt
+                system_prompt=self._system_prompt,
+                input_text=self._input_template.format(feedback_text=feedback_text)
             )
             
             if not response.success:
@@ -140,12 +292,16 @@ class HumanFeedbackParser:
                     error_message=f"LLM extraction failed: {response.error}"
                 )
             
-            # Parse the JSON response
+            # Parse the JSON response, reusing the client's decoded copy when present
             try:
-                parsed_data = json.loads(response.content)
+                parsed_data = response.parsed
+                if parsed_data is None:
+                    parsed_data = _jsonlib.loads(response.content)
                 feedback_items = self._convert_to_feedback_items(parsed_data.get('feedback_items', []))
                 
                 logger.info(f"Successfully parsed {len(feedback_items)} feedback items")
+                if cache_key is not None:
+                    self._store_cached_items(cache_key, tuple(replace(item) for item in feedback_items))
                 return ParsedHumanFeedback(
                     feedback_items=feedback_items,
                     raw_text=feedback_text,
@@ -170,6 +326,92 @@ class HumanFeedbackParser:
                 error_message=f"Parsing error: {str(e)}"
             )
     
+    def _result_cache_key(self, feedback_text: str) -> str:
+        """
+        Hash the model and normalized feedback text into a cache key.
+        
+        Runs of whitespace are collapsed so that re-pasted or re-indented
+        copies of the same feedback share an entry.
+        """
+        normalized = _WHITESPACE_RE.sub(' ', feedback_text).strip()
+        payload = f"{self.model}\n{normalized}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _get_cached_items(self, key: str) -> Optional[Tuple[FeedbackItem, ...]]:
+        """Return cached feedback items and mark them recently used."""
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+            return cached
+    
+    def _store_cached_items(self, key: str, items: Tuple[FeedbackItem, ...]):
+        """Store parsed feedback items, evicting the least recently used entry."""
+        with self._result_cache_lock:
+            self._result_cache[key] = items
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached parse results and requirement reference matches."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        self._cached_reference.cache_clear()
+    
+    async def parse_feedback_batch(self,
+                                   feedback_texts: List[str],
+                                   max_concurrency: Optional[int] = None) -> List[ParsedHumanFeedback]:
+        """
+        Parse several human feedback texts concurrently.
+        
+        Each text is parsed with :meth:`parse_feedback_text` in a worker thread,
+        so the LLM round-trips overlap and share the client's pooled session.
+        
+        Args:
+            feedback_texts: Raw human feedback texts
+            max_concurrency: Maximum number of texts parsed at once
+                (defaults to the client's connection pool size)
+            
+        Returns:
+            ParsedHumanFeedback for each text, in input order
+        """
+        return await self._parse_concurrently(self.parse_feedback_text, feedback_texts, max_concurrency)
+    
+    async def parse_feedback_files(self,
+                                   file_paths: List[TextSource],
+                                   max_concurrency: Optional[int] = None) -> List[ParsedHumanFeedback]:
+        """
+        Parse several human feedback files concurrently.
+        
+        Each file is read and parsed with :meth:`parse_feedback_file` in a worker
+        thread, so file reads and LLM round-trips of different files overlap.
+        
+        Args:
+            file_paths: Paths to human feedback files, or open file objects
+            max_concurrency: Maximum number of files parsed at once
+                (defaults to the client's connection pool size)
+            
+        Returns:
+            ParsedHumanFeedback for each file, in input order
+        """
+        return await self._parse_concurrently(self.parse_feedback_file, file_paths, max_concurrency)
+    
+    async def _parse_concurrently(self,
+                                  parse: Callable[[Any], ParsedHumanFeedback],
+                                  sources: List[Any],
+                                  max_concurrency: Optional[int]) -> List[ParsedHumanFeedback]:
+        """Run a blocking parse method over many sources in worker threads with bounded concurrency."""
+        if max_concurrency is None:
+            max_concurrency = getattr(self.llm_client, 'pool_maxsize', None) or self.DEFAULT_BATCH_CONCURRENCY
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_parse(source: Any) -> ParsedHumanFeedback:
+            async with semaphore:
+                return await asyncio.to_thread(parse, source)
+        
+        return list(await asyncio.gather(*(bounded_parse(source) for source in sources)))
+    
     def _convert_to_feedback_items(self, feedback_data: List[Dict[str, Any]]) -> List[FeedbackItem]:
         """
         Convert parsed JSON data to FeedbackItem objects.
@@ -183,62 +425,71 @@ class HumanFeedbackParser:
         feedback_items = []
         
         for item_data in feedback_data:
-            try:
-                feedback_item = FeedbackItem(
-                    requirement_reference=str(item_data.get('requirement_reference', '')).strip(),
-                    decision=str(item_data.get('decision', '')).strip(),
-                    rationale=str(item_data.get('rationale', '')).strip(),
-                    suggestion=str(item_data.get('suggestion', '')).strip(),
-                    confidence=str(item_data.get('confidence', '')).strip()
-                )
-                
-                # Validate that required fields are not empty
-                if not feedback_item.requirement_reference or not feedback_item.decision:
-                    logger.warning(f"Skipping feedback item with missing required fields: {item_data}")
-                    continue
-                
-                feedback_items.append(feedback_item)
-                
-            except Exception as e:
-                logger.warning(f"Error converting feedback item data: {str(e)}, data: {item_data}")
+            # Check the shape up front instead of catching errors per item;
+            # field reads cannot fail once the item is a mapping
+            if not isinstance(item_data, Mapping):
+                logger.warning(f"Skipping feedback item that is not an object: {item_data}")
                 continue
+            
+            # Validate that required fields are not empty before building the item
+            requirement_reference = _text_field(item_data, 'requirement_reference')
+            decision = _text_field(item_data, 'decision')
+            if not requirement_reference or not decision:
+                logger.warning(f"Skipping feedback item with missing required fields: {item_data}")
+                continue
+            
+            feedback_items.append(FeedbackItem(
+                requirement_reference=requirement_reference,
+                decision=decision,
+                rationale=_text_field(item_data, 'rationale'),
+                suggestion=_text_field(item_data, 'suggestion'),
+                confidence=_text_field(item_data, 'confidence')
+            ))
         
         return feedback_items
     
     def map_feedback_to_requirements(self, 
                                     feedback: ParsedHumanFeedback, 
-                                    compliance_requirements: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                    compliance_requirements: Sequence[RequirementLike]) -> Dict[str, Any]:
         """
         Map human feedback items to corresponding compliance requirements.
         
         Args:
             feedback: Parsed human feedback
-            compliance_requirements: List of compliance requirement dictionaries
+            compliance_requirements: Compliance requirement dictionaries, or
+                requirement objects such as ComplianceRequirement which are
+                read directly without converting them to dictionaries
             
         Returns:
-            Dictionary mapping requirement numbers to feedback items
+            Dictionary mapping requirement numbers to feedback items, with
+            each requirement as it was given
         """
         if not feedback.parsing_success:
             logger.error("Cannot map feedback: parsing was unsuccessful")
             return {}
         
         mapping = {}
-        req_dict = {req['requirement_number']: req for req in compliance_requirements}
+        req_dict = {_requirement_field(req, 'requirement_number'): req for req in compliance_requirements}
+        feedback_items = feedback.feedback_items
         
-        for item in feedback.feedback_items:
-            req_ref = item.requirement_reference
-            
-            # Clean up requirement reference (e.g., "R2" -> "R2")
-            req_ref = req_ref.strip().upper()
-            if req_ref.startswith('R') and req_ref[1:].isdigit():
-                req_num = req_ref
-            else:
-                # Try to extract requirement number using LLM if reference is unclear
-                req_num = self._extract_requirement_reference(item, compliance_requirements)
-            
-            if req_num in req_dict:
+        # Clean up requirement references (e.g., " r2" -> "R2") and collect
+        # the unclear ones so they are resolved together
+        references = [item.requirement_reference.strip().upper() for item in feedback_items]
+        req_nums = list(references)
+        unclear = [i for i, req_ref in enumerate(references) if not _REFERENCE_RE.fullmatch(req_ref)]
+        if unclear:
+            # Try to extract requirement numbers using LLM if references are unclear
+            resolved = self._extract_requirement_references(
+                [feedback_items[i] for i in unclear], compliance_requirements
+            )
+            for i, req_num in zip(unclear, resolved):
+                req_nums[i] = req_num
+        
+        for item, req_ref, req_num in zip(feedback_items, references, req_nums):
+            requirement = req_dict.get(req_num)
+            if requirement is not None:
                 mapping[req_num] = {
-                    'requirement': req_dict[req_num],
+                    'requirement': requirement,
                     'feedback': item.to_dict()
                 }
             else:
@@ -248,23 +499,56 @@ class HumanFeedbackParser:
     
     def _extract_requirement_reference(self, 
                                       feedback_item: FeedbackItem, 
-                                      compliance_requirements: List[Dict[str, Any]]) -> str:
+                                      compliance_requirements: Sequence[RequirementLike]) -> str:
         """
         Use LLM to extract the requirement reference when it's not clearly specified.
         
         Args:
             feedback_item: Feedback item to analyze
-            compliance_requirements: List of compliance requirement dictionaries
+            compliance_requirements: Compliance requirement dictionaries or objects
             
         Returns:
             Extracted requirement number or empty string if not found
         """
-        # Create a prompt to match feedback to requirements
-        requirements_text = "\n\n".join([
-            f"Requirement {req['requirement_number']}: {req['requirement_text']}"
-            for req in compliance_requirements
-        ])
+        try:
+            return self._cached_reference(
+                feedback_item.decision,
+                feedback_item.rationale,
+                feedback_item.suggestion,
+                _format_requirements(compliance_requirements),
+                self.model
+            )
+            
+        except Exception as e:
+            logger.error(f"Error extracting requirement reference: {str(e)}")
+            return ""
+    
+    def _match_requirement_reference(self,
+                                     decision: str,
+                                     rationale: str,
+                                     suggestion: str,
+                                     requirements_text: str,
+                                     model: str) -> str:
+        """
+        Ask the LLM which requirement a feedback item refers to.
+        
+        Results are memoized per parser by all arguments (see ``__init__``);
+        failures raise instead of returning so that they are not cached.
         
+        Args:
+            decision: Decision of the feedback item
+            rationale: Rationale of the feedback item
+            suggestion: Suggestion of the feedback item
+            requirements_text: Rendered list of available requirements
+            model: Model to use for matching
+            
+        Returns:
+            Extracted requirement number or empty string if not found
+            
+        Raises:
+            RuntimeError: If the LLM request fails
+        """
+        # Create a prompt to match feedback to requirements
         prompt = f"""
 Determine which requirement number this feedback item refers to.
 The feedback might mention the requirement explicitly or implicitly.
@@ -273,37 +557,98 @@ Available requirements:
 {requirements_text}
 
 Feedback item:
-Decision: {feedback_item.decision}
-Rationale: {feedback_item.rationale}
-Suggestion: {feedback_item.suggestion}
+Decision: {decision}
+Rationale: {rationale}
+Suggestion: {suggestion}
 
 Return only the requirement number (e.g., R1, R2) that this feedback most likely refers to.
 """
         
-        system_prompt = "You are an expert at matching feedback to requirements. Identify which requirement a feedback item refers to based on context clues."
+        response = self.llm_client.generate(
+            prompt=prompt,
+            model=model,
+            system_prompt=_REFERENCE_SYSTEM_PROMPT,
+            temperature=0.1
+        )
+        
+        if not response.success:
+            raise RuntimeError(f"LLM generation failed: {response.error}")
+        
+        # Extract requirement number from response
+        content = response.content.strip()
+        # Look for patterns like "R1", "R2", etc.
+        matches = _REFERENCE_RE.search(content)
+        if matches:
+            return matches.group(0).upper()
+        return ""
+    
+    def _extract_requirement_references(self,
+                                        feedback_items: Sequence[FeedbackItem],
+                                        compliance_requirements: Sequence[RequirementLike]) -> List[str]:
+        """
+        Use LLM to extract requirement references for several unclear feedback items.
+        
+        All items are matched in a single request, so the requirements list is
+        sent once rather than once per item.
+        
+        Args:
+            feedback_items: Feedback items to analyze
+            compliance_requirements: Compliance requirement dictionaries or objects
+            
+        Returns:
+            Extracted requirement number for each item, or an empty string
+            where none was found
+        """
+        if len(feedback_items) == 1:
+            return [self._extract_requirement_reference(feedback_items[0], compliance_requirements)]
+        
+        references = [""] * len(feedback_items)
+        items_text = "\n\n".join([
+            f"Item {number}:\n"
+            f"Decision: {item.decision}\n"
+            f"Rationale: {item.rationale}\n"
+            f"Suggestion: {item.suggestion}"
+            for number, item in enumerate(feedback_items, 1)
+        ])
+        
+        prompt = f"""
+Determine which requirement number each feedback item below refers to.
+The feedback might mention the requirement explicitly or implicitly.
+
+Available requirements:
+{_format_requirements(compliance_requirements)}
+
+Feedback items:
+{items_text}
+
+For every item, give its item number and the requirement number (e.g., R1, R2) it most likely refers to.
+"""
         
         try:
-            response = self.llm_client.generate(
+            response = self.llm_client.extract_structured_data(
                 prompt=prompt,
+                expected_schema=_REFERENCE_BATCH_SCHEMA,
                 model=self.model,
-                system_prompt=system_prompt,
-                temperature=0.1
+                system_prompt=_REFERENCE_SYSTEM_PROMPT
             )
             
             if response.success:
-                # Extract requirement number from response
-                content = response.content.strip()
-                # Look for patterns like "R1", "R2", etc.
-                import re
-                matches = re.search(r'R\d+', content, re.IGNORECASE)
-                if matches:
-                    return matches.group(0).upper()
+                parsed_data = response.parsed
+                if parsed_data is None:
+                    parsed_data = _jsonlib.loads(response.content)
+                for entry in parsed_data.get('mappings', []):
+                    number = _item_number(entry.get('item'))
+                    match = _REFERENCE_RE.search(str(entry.get('requirement_number', '')))
+                    if number is None or not 1 <= number <= len(references) or not match:
+                        logger.warning(f"Skipping invalid requirement reference mapping: {entry}")
+                        continue
+                    references[number - 1] = match.group(0).upper()
             
-            return ""
+            return references
             
         except Exception as e:
-            logger.error(f"Error extracting requirement reference: {str(e)}")
-            return ""
+            logger.error(f"Error extracting requirement references: {str(e)}")
+            return references
     
     def validate_parsed_data(self, parsed_feedback: ParsedHumanFeedback) -> Dict[str, Any]:
         """
@@ -338,8 +683,10 @@ Return only the requirement number (e.g., R1, R2) that this feedback most likely
             validation_results['errors'].append("No feedback items found in the text")
             return validation_results
         
-        # Validate individual feedback items
+        # Validate individual feedback items, counting references in the same pass
+        reference_counts = Counter()
         for i, item in enumerate(parsed_feedback.feedback_items):
+            reference_counts[item.requirement_reference] += 1
             item_errors = []
             
             # Check required fields
@@ -351,25 +698,16 @@ Return only the requirement number (e.g., R1, R2) that this feedback most likely
                 item_errors.append("Missing rationale")
             
             # Count decision types
-            decision_lower = item.decision.lower()
-            if 'accept' in decision_lower or 'no change' in decision_lower:
-                validation_results['statistics']['accept_count'] += 1
-            elif 'reject' in decision_lower:
-                validation_results['statistics']['reject_count'] += 1
-            elif 'modify' in decision_lower or 'change' in decision_lower:
-                validation_results['statistics']['modify_count'] += 1
-            else:
-                validation_results['statistics']['other_decision_count'] += 1
+            validation_results['statistics'][_DECISION_COUNT_KEYS[item.category]] += 1
             
             if item_errors:
                 validation_results['errors'].extend([f"Feedback item {i+1}: {error}" for error in item_errors])
                 validation_results['is_valid'] = False
         
         # Check for duplicate requirement references
-        req_refs = [item.requirement_reference for item in parsed_feedback.feedback_items]
-        duplicates = set([ref for ref in req_refs if req_refs.count(ref) > 1])
+        duplicates = [ref for ref, count in reference_counts.items() if count > 1]
         if duplicates:
-            validation_results['warnings'].append(f"Duplicate requirement references found: {list(duplicates)}")
+            validation_results['warnings'].append(f"Duplicate requirement references found: {duplicates}")
         
         return validation_results
     
@@ -384,11 +722,65 @@ Return only the requirement number (e.g., R1, R2) that this feedback most likely
         Returns:
             List of feedback items matching the decision type
         """
+        return list(self.iter_feedback_by_decision(parsed_feedback, decision_type))
+    
+    def iter_feedback_by_decision(self, parsed_feedback: ParsedHumanFeedback, decision_type: str) -> Iterator[FeedbackItem]:
+        """
+        Lazily filter feedback items by decision type.
+        
+        Items are produced one at a time, so callers that stop early (e.g. with
+        ``next`` or ``any``) do not scan or collect the remaining items.
+        
+        Args:
+            parsed_feedback: Parsed human feedback
+            decision_type: Decision type to filter by (case-insensitive)
+            
+        Returns:
+            Iterator over feedback items matching the decision type
+        """
         decision_lower = decision_type.lower()
-        return [
-            item for item in parsed_feedback.feedback_items 
+        return (
+            item for item in parsed_feedback.feedback_items
             if decision_lower in item.decision.lower()
-        ]
+        )
+    
+    def get_feedback_by_category(self, parsed_feedback: ParsedHumanFeedback, category: str) -> List[FeedbackItem]:
+        """
+        Filter feedback items by decision category.
+        
+        Unlike :meth:`get_feedback_by_decision` this compares the precomputed
+        category of each item instead of searching its decision text.
+        
+        Args:
+            parsed_feedback: Parsed human feedback
+            category: One of DECISION_CATEGORIES
+            
+        Returns:
+            List of feedback items in the category
+            
+        Raises:
+            ValueError: If the category is unknown
+        """
+        return list(self.iter_feedback_by_category(parsed_feedback, category))
+    
+    def iter_feedback_by_category(self, parsed_feedback: ParsedHumanFeedback, category: str) -> Iterator[FeedbackItem]:
+        """
+        Lazily filter feedback items by decision category.
+        
+        Args:
+            parsed_feedback: Parsed human feedback
+            category: One of DECISION_CATEGORIES
+            
+        Returns:
+            Iterator over feedback items in the category
+            
+        Raises:
+            ValueError: If the category is unknown (raised immediately, not
+                on first iteration)
+        """
+        if category not in _DECISION_COUNT_KEYS:
+            raise ValueError(f"Unsupported decision category: {category}. Supported: {list(DECISION_CATEGORIES)}")
+        return (item for item in parsed_feedback.feedback_items if item.category == category)
     
     def get_parsing_statistics(self, parsed_feedback: ParsedHumanFeedback) -> Dict[str, Any]:
         """
@@ -407,15 +799,23 @@ Return only the requirement number (e.g., R1, R2) that this feedback most likely
                 'total_feedback_items': 0
             }
         
+        feedback_items = parsed_feedback.feedback_items
+        
+        # Gather all statistics in a single pass over the feedback items
         decision_counts = {}
-        for item in parsed_feedback.feedback_items:
+        suggestion_count = 0
+        total_rationale_length = 0
+        for item in feedback_items:
             decision = item.decision
             decision_counts[decision] = decision_counts.get(decision, 0) + 1
+            if item.suggestion.strip():
+                suggestion_count += 1
+            total_rationale_length += len(item.rationale)
         
         return {
             'parsing_success': True,
-            'total_feedback_items': len(parsed_feedback.feedback_items),
+            'total_feedback_items': len(feedback_items),
             'decision_distribution': decision_counts,
-            'has_suggestions': sum(1 for item in parsed_feedback.feedback_items if item.suggestion.strip()),
-            'average_rationale_length': sum(len(item.rationale) for item in parsed_feedback.feedback_items) / len(parsed_feedback.feedback_items) if parsed_feedback.feedback_items else 0
+            'has_suggestions': suggestion_count,
+            'average_rationale_length': total_rationale_length / len(feedback_items) if feedback_items else 0
         }
\ No newline at end of file
@@ -3,7 +3,9 @@
 import json
 import logging
 import re
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Mapping
 from dataclasses import dataclass
 
 from ..llm.client import LLMClient, LLMResponse
@@ -28,15 +30,19 @@ class ScenarioIdGenerator:
     Uses Ollama LLM to extract key concepts from requirement text.
     """
     
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    def __init__(self, llm_client: Optional[LLMClient] = None, cache_size: int = 4096):
         """
         Initialize the scenario ID generator.
         
         Args:
             llm_client: Optional LLM client instance. If None, creates a new one.
+            cache_size: Maximum number of extracted ID components kept per
+                (requirement text, domain, requirement number)
         """
         self.llm_client = llm_client or LLMClient()
         self._generated_ids = set()  # Track generated IDs for uniqueness
+        # Extraction is deterministic in its inputs; failures raise and are not cached
+        self._cached_id_components = lru_cache(maxsize=cache_size)(self._extract_id_components)
     
     def generate_scenario_id(self, 
                            requirement_text: str, 
@@ -58,32 +64,94 @@ class ScenarioIdGenerator:
         """
         try:
             # Extract components using LLM
-            components = self._extract_id_components(
+            components = self._cached_id_components(
                 requirement_text, 
                 domain, 
                 requirement_number
             )
             
-            # Generate base ID
-            base_id = f"{components.domain}_{components.requirement_number}_{components.key_concept}"
+            return self._assign_scenario_id(components)
             
-            # Ensure uniqueness
-            unique_id = self._ensure_uniqueness(base_id)
+        except Exception as e:
+            logger.error(f"Failed to generate scenario ID: {str(e)}")
+            raise ValueError(f"Scenario ID generation failed: {str(e)}")
+    
+    def generate_scenario_ids(self,
+                              requirements: Iterable[Mapping[str, Optional[str]]],
+                              max_workers: Optional[int] = None) -> List[str]:
+        """
+        Generate unique scenario IDs for many requirements.
+        
+        The LLM extraction for each requirement runs in a thread pool since the
+        requirements are independent; IDs are then assigned in input order so
+        uniqueness suffixes are the same as for sequential calls.
+        
+        Args:
+            requirements: Keyword arguments for generate_scenario_id, one mapping
+                per requirement (requirement_text, optional domain and
+                requirement_number)
+            max_workers: Maximum concurrent LLM requests; defaults to the
+                client's connection pool size
             
-            # Validate format
-            if not self._validate_id_format(unique_id):
-                raise ValueError(f"Generated ID '{unique_id}' does not match expected format")
+        Returns:
+            Generated scenario IDs in the same order as the requirements
             
-            # Track generated ID
-            self._generated_ids.add(unique_id)
+        Raises:
+            ValueError: If ID generation fails for any requirement
+        """
+        requirements = list(requirements)
+        if not requirements:
+            return []
+        
+        if max_workers is None:
+            max_workers = getattr(self.llm_client, 'pool_maxsize', None)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                all_components = list(executor.map(
+                    lambda kwargs: self._cached_id_components(
+                        kwargs['requirement_text'],
+                        kwargs.get('domain'),
+                        kwargs.get('requirement_number')
+                    ),
+                    requirements
+                ))
             
-            logger.info(f"Generated scenario ID: {unique_id}")
-            return unique_id
+            return [self._assign_scenario_id(components) for components in all_components]
             
         except Exception as e:
-            logger.error(f"Failed to generate scenario ID: {str(e)}")
+            logger.error(f"Failed to generate scenario IDs: {str(e)}")
             raise ValueError(f"Scenario ID generation failed: {str(e)}")
     
+    def _assign_scenario_id(self, components: ScenarioIdComponents) -> str:
+        """
+        Build, validate and record a unique scenario ID from its components.
+        
+        Args:
+            components: Extracted ID components
+            
+        Returns:
+            Unique scenario ID
+            
+        Raises:
+            ValueError: If the ID does not match the expected format
+        """
+        # Generate base ID
+        base_id = f"{components.domain}_{components.requirement_number}_{components.key_concept}"
+        
+        # Ensure uniqueness
+        unique_id = self._ensure_uniqueness(base_id)
+        
+        # Validate format
+        if not self._validate_id_format(unique_id):
+            raise ValueError(f"Generated ID '{unique_id}' does not match expected format")
+        
+        # Track generated ID
+        self._generated_ids.add(unique_id)
+        
+        logger.info(f"Generated scenario ID: {unique_id}")
+        return unique_id
+    
     def _extract_id_components(self, 
                               requirement_text: str,
                               domain_override: Optional[str] = None,
@@ -262,6 +330,10 @@ Respond with valid JSON only."""
         """Reset the set of generated IDs for testing purposes."""
         self._generated_ids.clear()
     
+    def clear_cache(self):
+        """Clear the cache of extracted ID components."""
+        self._cached_id_components.cache_clear()
+    
     def get_generated_ids(self) -> set:
         """Get the set of generated IDs for testing purposes."""
         return self._generated_ids.copy()
\ No newline at end of file
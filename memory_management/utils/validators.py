@@ -34,8 +34,7 @@ class DataValidator:
                 errors.append("final_status is required and cannot be empty")
             
             # Validate scenario_id format
-            parts = entry.scenario_id.split('_') if entry.scenario_id else []
-            if len(parts) < 3:
+            if not entry.scenario_id or entry.scenario_id.count('_') < 2:
                 errors.append("scenario_id must follow format: {domain}_{requirement_number}_{key_concept}")
             
             # Validate nested objects
@@ -69,8 +68,7 @@ class DataValidator:
                 errors.append("rule_text is required and cannot be empty")
             
             # Validate rule_id format
-            parts = rule.rule_id.split('_') if rule.rule_id else []
-            if len(parts) < 3:
+            if not rule.rule_id or rule.rule_id.count('_') < 2:
                 errors.append("rule_id must follow format: {policy}_{concept}_{version}")
             
             if not rule.related_concepts or len(rule.related_concepts) == 0:
@@ -1,5 +1,7 @@
 """Unit tests for ComplianceReportParser."""
 
+import asyncio
+import io
 import json
 import pytest
 import tempfile
@@ -12,6 +14,7 @@ from memory_management.parsers.compliance_report_parser import (
     ParsedComplianceReport
 )
 from memory_management.llm.client import LLMClient, LLMResponse
+from memory_management.llm.prompts import PromptTemplates
 
 
 class TestComplianceRequirement:
@@ -118,6 +121,11 @@ class TestComplianceReportParser:
         """Create a ComplianceReportParser instance with mock LLM client."""
         return ComplianceReportParser(llm_client=mock_llm_client)
     
+    @pytest.fixture
+    def raw_text_parser(self, mock_llm_client):
+        """Create a ComplianceReportParser that keeps the raw report text."""
+        return ComplianceReportParser(llm_client=mock_llm_client, keep_raw_text=True)
+    
     @pytest.fixture
     def sample_report_text(self):
         """Sample compliance report text for testing."""
@@ -169,6 +177,7 @@ class TestComplianceReportParser:
         parser = ComplianceReportParser()
         assert parser.llm_client is not None
         assert parser.model == 'qwq:32b'
+        assert parser.keep_raw_text is False
         
         # Test with custom LLM client and model
         mock_client = Mock(spec=LLMClient)
@@ -191,7 +200,7 @@ class TestComplianceReportParser:
         assert result.parsing_success is True
         assert result.error_message is None
         assert len(result.requirements) == 2
-        assert result.raw_text == sample_report_text
+        assert result.raw_text == ""
         
         # Check first requirement
         req1 = result.requirements[0]
@@ -205,6 +214,61 @@ class TestComplianceReportParser:
         assert req2.status == "Compliant"
         assert "SHA-256" in req2.requirement_text
     
+    def test_parse_report_text_request(self, parser, mock_llm_client, sample_report_text, sample_llm_response):
+        """Test that the LLM request sends the static template prefix with the report as input text."""
+        mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(sample_llm_response),
+            model='qwq:32b',
+            success=True
+        )
+        template_data = PromptTemplates.compliance_report_extraction()
+        
+        parser.parse_report_text(sample_report_text)
+        parser.parse_report_text(sample_report_text)
+        
+        mock_llm_client.extract_structured_data.assert_called_with(
+            prompt=template_data["prefix"].rstrip(),
+            expected_schema=template_data["schema"],
+            model='qwq:32b',
+            system_prompt=PromptTemplates.get_system_prompts()["compliance_extraction"],
+            input_text=template_data["suffix_template"].format(report_text=sample_report_text)
+        )
+    
+    def test_parse_report_text_keep_raw_text(self, raw_text_parser, mock_llm_client, sample_report_text, sample_llm_response):
+        """Test that raw text is kept when requested and on failed parses."""
+        mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(sample_llm_response),
+            model='qwq:32b',
+            success=True
+        )
+        assert raw_text_parser.parse_report_text(sample_report_text).raw_text == sample_report_text
+        
+        mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content="",
+            model='qwq:32b',
+            success=False,
+            error="Connection error"
+        )
+        parser = ComplianceReportParser(llm_client=mock_llm_client)
+        assert parser.parse_report_text(sample_report_text).raw_text == sample_report_text
+    
+    def test_parse_report_batch(self, parser, mock_llm_client, sample_report_text, sample_llm_response):
+        """Test concurrent parsing of several reports keeps input order."""
+        mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(sample_llm_response),
+            model='qwq:32b',
+            success=True
+        )
+        
+        results = asyncio.run(parser.parse_report_batch(
+            [sample_report_text, "   ", sample_report_text], max_concurrency=2
+        ))
+        
+        assert [r.parsing_success for r in results] == [True, False, True]
+        assert results[1].error_message == "Empty report text provided"
+        assert len(results[2].requirements) == 2
+        assert mock_llm_client.extract_structured_data.call_count == 2
+    
     def test_parse_report_text_empty_input(self, parser):
         """Test parsing with empty input text."""
         result = parser.parse_report_text("")
@@ -230,6 +294,23 @@ class TestComplianceReportParser:
         assert "LLM extraction failed: Connection timeout" in result.error_message
         assert len(result.requirements) == 0
     
+    def test_parse_report_text_uses_parsed_response(self, parser, mock_llm_client, sample_report_text, sample_llm_response):
+        """Test that an already decoded response is used without parsing the content again."""
+        mock_response = LLMResponse(
+            content=json.dumps(sample_llm_response),
+            model='qwq:32b',
+            success=True,
+            parsed=sample_llm_response
+        )
+        mock_llm_client.extract_structured_data.return_value = mock_response
+        
+        with patch('memory_management.parsers.compliance_report_parser._jsonlib.loads') as mock_loads:
+            result = parser.parse_report_text(sample_report_text)
+        
+        assert result.parsing_success is True
+        assert len(result.requirements) == 2
+        mock_loads.assert_not_called()
+    
     def test_parse_report_text_invalid_json(self, parser, mock_llm_client, sample_report_text):
         """Test handling of invalid JSON response from LLM."""
         # Mock LLM response with invalid JSON
@@ -246,7 +327,7 @@ class TestComplianceReportParser:
         assert "JSON parsing error" in result.error_message
         assert len(result.requirements) == 0
     
-    def test_parse_report_file_success(self, parser, mock_llm_client, sample_report_text, sample_llm_response):
+    def test_parse_report_file_success(self, raw_text_parser, mock_llm_client, sample_report_text, sample_llm_response):
         """Test successful parsing of compliance report from file."""
         # Create temporary file with sample content
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as temp_file:
@@ -262,7 +343,7 @@ class TestComplianceReportParser:
             )
             mock_llm_client.extract_structured_data.return_value = mock_response
             
-            result = parser.parse_report_file(temp_file_path)
+            result = raw_text_parser.parse_report_file(temp_file_path)
             
             assert result.parsing_success is True
             assert len(result.requirements) == 2
@@ -272,6 +353,44 @@ class TestComplianceReportParser:
             # Clean up temporary file
             os.unlink(temp_file_path)
     
+    def test_parse_report_file_object(self, raw_text_parser, mock_llm_client, sample_report_text, sample_llm_response):
+        """Test parsing a compliance report from in-memory file objects."""
+        mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(sample_llm_response),
+            model='qwq:32b',
+            success=True
+        )
+        
+        for source in (io.StringIO(sample_report_text), io.BytesIO(sample_report_text.encode('utf-8'))):
+            result = raw_text_parser.parse_report_file(source)
+            
+            assert result.parsing_success is True
+            assert len(result.requirements) == 2
+            assert result.raw_text == sample_report_text
+    
+    def test_parse_report_file_newlines_and_empty(self, raw_text_parser, mock_llm_client):
+        """Test that memory-mapped reads normalize newlines and handle empty files."""
+        mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content='{"requirements": []}',
+            model='qwq:32b',
+            success=True
+        )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, 'report.txt')
+            with open(report_path, 'wb') as report_file:
+                report_file.write('R1: Encrypt – data\r\nR2: Log access\r'.encode('utf-8'))
+            
+            result = raw_text_parser.parse_report_file(report_path)
+            assert result.raw_text == 'R1: Encrypt – data\nR2: Log access\n'
+            
+            empty_path = os.path.join(temp_dir, 'empty.txt')
+            open(empty_path, 'wb').close()
+            
+            result = raw_text_parser.parse_report_file(empty_path)
+            assert result.parsing_success is False
+            assert result.error_message == "Empty report text provided"
+    
     def test_parse_report_file_not_found(self, parser):
         """Test handling of non-existent file."""
         result = parser.parse_report_file("non_existent_file.txt")
@@ -331,6 +450,32 @@ class TestComplianceReportParser:
         assert len(requirements) == 1
         assert requirements[0].requirement_number == "R1"
     
+    def test_convert_to_requirements_non_string_values(self, parser):
+        """Test that values are stripped and non-string values are normalized."""
+        requirements_data = [
+            {
+                "requirement_number": 3,
+                "requirement_text": "  Test requirement 3\n",
+                "status": " Partial ",
+                "rationale": None,
+                "recommendation": "Test recommendation 3"
+            },
+            {
+                "requirement_number": None,
+                "requirement_text": "Test requirement 4",
+                "status": "Compliant"
+            }
+        ]
+        
+        requirements = parser._convert_to_requirements(requirements_data)
+        
+        # A null requirement number counts as missing, not as the text "None"
+        assert len(requirements) == 1
+        assert requirements[0].requirement_number == "3"
+        assert requirements[0].requirement_text == "Test requirement 3"
+        assert requirements[0].status == "Partial"
+        assert requirements[0].rationale == ""
+    
     def test_validate_parsed_data_success(self, parser):
         """Test validation of successfully parsed data."""
         requirements = [
@@ -364,6 +509,46 @@ class TestComplianceReportParser:
         assert validation['statistics']['compliant_count'] == 1
         assert validation['statistics']['non_compliant_count'] == 1
     
+    def test_validate_parsed_data_status_counts(self, parser):
+        """Test classification of requirement statuses into statistics counters."""
+        statuses = [
+            "Compliant", "COMPLIANT", "Non-Compliant", "non compliant",
+            "Partially Compliant", "Partial", "Not Applicable", "Compliant"
+        ]
+        requirements = [
+            ComplianceRequirement(f"R{index}", "Text", status, "Rationale", "")
+            for index, status in enumerate(statuses)
+        ]
+        parsed_report = ParsedComplianceReport(
+            requirements=requirements,
+            raw_text="Test raw text",
+            parsing_success=True
+        )
+        
+        statistics = parser.validate_parsed_data(parsed_report)['statistics']
+        
+        assert statistics['compliant_count'] == 3
+        assert statistics['non_compliant_count'] == 2
+        assert statistics['partially_compliant_count'] == 2
+        assert statistics['other_status_count'] == 1
+    
+    def test_validate_parsed_data_duplicates(self, parser):
+        """Test that duplicate requirement numbers are reported once each."""
+        requirements = [
+            ComplianceRequirement(number, f"Requirement {index}", "Compliant", "Rationale", "")
+            for index, number in enumerate(["R1", "R2", "R1", "R3", "R2", "R1"])
+        ]
+        parsed_report = ParsedComplianceReport(
+            requirements=requirements,
+            raw_text="Test raw text",
+            parsing_success=True
+        )
+        
+        validation = parser.validate_parsed_data(parsed_report)
+        
+        assert validation['is_valid'] is True
+        assert validation['warnings'] == ["Duplicate requirement numbers found: ['R1', 'R2']"]
+    
     def test_validate_parsed_data_parsing_failure(self, parser):
         """Test validation of failed parsing."""
         parsed_report = ParsedComplianceReport(
@@ -1,13 +1,19 @@
 """Unit tests for the HumanFeedbackParser."""
 
+import asyncio
+import io
+import os
+import tempfile
 import unittest
 import json
 from unittest.mock import MagicMock, patch
 from memory_management.parsers.human_feedback_parser import (
     HumanFeedbackParser, 
     ParsedHumanFeedback,
-    FeedbackItem
+    FeedbackItem,
+    _format_requirements
 )
+from memory_management.parsers.compliance_report_parser import ComplianceRequirement
 from memory_management.llm.client import LLMResponse
 
 
@@ -78,6 +84,144 @@ This is the most critical error in the report. The agent marked this as "Complia
         self.assertEqual(result.feedback_items[1].requirement_reference, "R4")
         self.assertIn("Partially Compliant", result.feedback_items[1].decision)
     
+    def test_parse_feedback_text_prompt_prefix(self):
+        """Test that only the feedback text varies between extraction requests."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(self.sample_llm_response),
+            model="qwq:32b",
+            success=True
+        )
+        
+        self.parser.parse_feedback_text("Feedback on R1: accept.")
+        first_call = self.mock_llm_client.extract_structured_data.call_args.kwargs
+        self.parser.parse_feedback_text(self.sample_feedback)
+        second_call = self.mock_llm_client.extract_structured_data.call_args.kwargs
+        
+        self.assertIs(first_call['prompt'], second_call['prompt'])
+        self.assertTrue(first_call['prompt'].startswith("Extract structured information"))
+        self.assertEqual(first_call['input_text'], "Human Feedback Text:\nFeedback on R1: accept.")
+        self.assertTrue(second_call['input_text'].endswith(self.sample_feedback))
+    
+    def test_parse_feedback_text_cache(self):
+        """Test that repeated feedback texts are parsed by the LLM only once."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(self.sample_llm_response),
+            model="qwq:32b",
+            success=True
+        )
+        
+        first = self.parser.parse_feedback_text(self.sample_feedback)
+        first.feedback_items[0].decision = "Edited by caller"
+        reindented = "  " + self.sample_feedback.replace("\n", "\n\n  ")
+        second = self.parser.parse_feedback_text(reindented)
+        
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 1)
+        self.assertTrue(second.parsing_success)
+        self.assertEqual(second.raw_text, reindented)
+        self.assertEqual(second.feedback_items[0].decision, "Modify")
+        
+        self.parser.clear_cache()
+        self.parser.parse_feedback_text(self.sample_feedback)
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 2)
+    
+    def test_parse_feedback_text_cache_skips_failures(self):
+        """Test that failed parses are not cached and caching can be disabled."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content="",
+            model="qwq:32b",
+            success=False,
+            error="LLM API error"
+        )
+        self.parser.parse_feedback_text(self.sample_feedback)
+        self.parser.parse_feedback_text(self.sample_feedback)
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 2)
+        
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(self.sample_llm_response),
+            model="qwq:32b",
+            success=True
+        )
+        parser = HumanFeedbackParser(llm_client=self.mock_llm_client, cache_size=0)
+        parser.parse_feedback_text(self.sample_feedback)
+        parser.parse_feedback_text(self.sample_feedback)
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 4)
+    
+    def test_parse_feedback_batch(self):
+        """Test concurrent parsing of several feedback texts keeps input order."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(self.sample_llm_response),
+            model="qwq:32b",
+            success=True
+        )
+        
+        results = asyncio.run(self.parser.parse_feedback_batch(
+            ["", self.sample_feedback, self.sample_feedback + "\nThanks."], max_concurrency=2
+        ))
+        
+        self.assertEqual([r.parsing_success for r in results], [False, True, True])
+        self.assertIn("Empty feedback text", results[0].error_message)
+        self.assertEqual(results[2].feedback_items[1].requirement_reference, "R4")
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 2)
+    
+    def test_parse_feedback_text_decoding(self):
+        """Test that decoded responses are reused and invalid JSON is reported."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(self.sample_llm_response),
+            model="qwq:32b",
+            success=True,
+            parsed=self.sample_llm_response
+        )
+        with patch('memory_management.parsers.human_feedback_parser._jsonlib.loads') as mock_loads:
+            result = self.parser.parse_feedback_text(self.sample_feedback)
+        self.assertTrue(result.parsing_success)
+        self.assertEqual(len(result.feedback_items), 2)
+        mock_loads.assert_not_called()
+        
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content="not json",
+            model="qwq:32b",
+            success=True
+        )
+        result = self.parser.parse_feedback_text("Feedback on R1: accept.")
+        self.assertFalse(result.parsing_success)
+        self.assertIn("JSON parsing error", result.error_message)
+    
+    def test_parse_feedback_files(self):
+        """Test concurrent parsing of several feedback files keeps input order."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps(self.sample_llm_response),
+            model="qwq:32b",
+            success=True
+        )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            feedback_path = os.path.join(temp_dir, 'feedback.txt')
+            with open(feedback_path, 'w', encoding='utf-8') as feedback_file:
+                feedback_file.write(self.sample_feedback)
+            
+            results = asyncio.run(self.parser.parse_feedback_files([
+                feedback_path,
+                os.path.join(temp_dir, 'missing.txt'),
+                io.StringIO("Feedback on R1: accept.")
+            ], max_concurrency=2))
+        
+        self.assertEqual([r.parsing_success for r in results], [True, False, True])
+        self.assertIn("File not found", results[1].error_message)
+        self.assertEqual(results[0].feedback_items[1].requirement_reference, "R4")
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 2)
+    
+    def test_convert_to_feedback_items_normalizes_values(self):
+        """Test that values are normalized and incomplete or malformed items are skipped."""
+        feedback_items = self.parser._convert_to_feedback_items([
+            {"requirement_reference": " R2 ", "decision": "Modify\n", "rationale": None,
+             "suggestion": "Use events", "confidence": 0.9},
+            {"requirement_reference": None, "decision": "Accept"},
+            "R3: Accept",
+            None
+        ])
+        
+        self.assertEqual(feedback_items, [FeedbackItem("R2", "Modify", "", "Use events", "0.9")])
+    
     def test_parse_feedback_text_llm_failure(self):
         """Test handling of LLM failure during parsing."""
         # Mock LLM client to return an error
@@ -106,9 +250,8 @@ This is the most critical error in the report. The agent marked this as "Complia
         self.assertEqual(len(result.feedback_items), 0)
         self.assertIn("Empty feedback text", result.error_message)
     
-    @patch('builtins.open', new_callable=unittest.mock.mock_open, read_data="Sample feedback text")
-    def test_parse_feedback_file_success(self, mock_open):
-        """Test successful parsing from a file."""
+    def test_parse_feedback_file_success(self):
+        """Test successful parsing from a memory-mapped file."""
         # Mock the parse_feedback_text method
         self.parser.parse_feedback_text = MagicMock(return_value=ParsedHumanFeedback(
             feedback_items=[
@@ -124,12 +267,17 @@ This is the most critical error in the report. The agent marked this as "Complia
         ))
         
         # Parse from file
-        result = self.parser.parse_feedback_file("dummy_path.txt")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            feedback_path = os.path.join(temp_dir, 'feedback.txt')
+            with open(feedback_path, 'wb') as feedback_file:
+                feedback_file.write("Sample feedback – R1\r\nAccept\r".encode('utf-8'))
+            
+            result = self.parser.parse_feedback_file(feedback_path)
         
         # Verify the result
         self.assertTrue(result.parsing_success)
         self.assertEqual(len(result.feedback_items), 1)
-        mock_open.assert_called_once_with("dummy_path.txt", "r", encoding="utf-8")
+        self.parser.parse_feedback_text.assert_called_once_with("Sample feedback – R1\nAccept\n")
     
     def test_parse_feedback_file_not_found(self):
         """Test handling of file not found error."""
@@ -173,6 +321,30 @@ This is the most critical error in the report. The agent marked this as "Complia
         self.assertEqual(result['statistics']['accept_count'], 1)
         self.assertEqual(result['statistics']['modify_count'], 1)
     
+    def test_validate_parsed_data_decisions_and_duplicates(self):
+        """Test decision counts and duplicate reference warnings."""
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[
+                FeedbackItem("R1", "No change needed", "Correct", ""),
+                FeedbackItem("R2", "Reject", "Wrong", ""),
+                FeedbackItem("R4", "Change status to Partial", "Unsalted", "Salt"),
+                FeedbackItem("R2", "Escalate", "Unclear", ""),
+                FeedbackItem("R4", "Accept", "Fine", ""),
+                FeedbackItem("R2", "Accept", "Fine", "")
+            ],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        
+        result = self.parser.validate_parsed_data(parsed_feedback)
+        
+        statistics = result['statistics']
+        self.assertEqual(statistics['accept_count'], 3)
+        self.assertEqual(statistics['reject_count'], 1)
+        self.assertEqual(statistics['modify_count'], 1)
+        self.assertEqual(statistics['other_decision_count'], 1)
+        self.assertEqual(result['warnings'], ["Duplicate requirement references found: ['R2', 'R4']"])
+    
     def test_validate_parsed_data_invalid(self):
         """Test validation of invalid parsed data."""
         # Create an invalid parsed feedback (missing required fields)
@@ -232,6 +404,89 @@ This is the most critical error in the report. The agent marked this as "Complia
         self.assertEqual(accept_items[0].requirement_reference, "R1")
         self.assertEqual(accept_items[1].requirement_reference, "R3")
     
+    def test_feedback_dataclasses_use_slots(self):
+        """Test that feedback instances carry no per-instance __dict__."""
+        item = FeedbackItem("R1", "Accept", "Good", "")
+        parsed_feedback = ParsedHumanFeedback([item], "Sample feedback", True)
+        
+        self.assertFalse(hasattr(item, '__dict__'))
+        self.assertFalse(hasattr(parsed_feedback, '__dict__'))
+        self.assertEqual(parsed_feedback.to_dict()['feedback_items'], [item.to_dict()])
+    
+    def test_get_feedback_by_category(self):
+        """Test filtering feedback items by their decision category."""
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[
+                FeedbackItem("R1", "No change needed", "Correct", ""),
+                FeedbackItem("R2", "Change status to Partial", "Unsalted", "Salt"),
+                FeedbackItem("R3", "Accept", "Fine", ""),
+                FeedbackItem("R4", "Escalate", "Unclear", "")
+            ],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        
+        self.assertEqual([item.category for item in parsed_feedback.feedback_items],
+                         ["accept", "modify", "accept", "other"])
+        accept_items = self.parser.get_feedback_by_category(parsed_feedback, "accept")
+        self.assertEqual([item.requirement_reference for item in accept_items], ["R1", "R3"])
+        self.assertEqual(self.parser.get_feedback_by_category(parsed_feedback, "reject"), [])
+        with self.assertRaises(ValueError):
+            self.parser.get_feedback_by_category(parsed_feedback, "Accept")
+        with self.assertRaises(ValueError):
+            self.parser.iter_feedback_by_category(parsed_feedback, "Accept")
+        
+        # Lazy variants yield matches one at a time
+        modify_items = self.parser.iter_feedback_by_category(parsed_feedback, "modify")
+        self.assertEqual(next(modify_items).requirement_reference, "R2")
+        self.assertIsNone(next(modify_items, None))
+        change_items = self.parser.iter_feedback_by_decision(parsed_feedback, "change")
+        self.assertEqual([item.requirement_reference for item in change_items], ["R1", "R2"])
+    
+    def test_parsed_feedback_json_bytes(self):
+        """Test that JSON output matches to_dict with and without orjson."""
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[FeedbackItem("R4", "Modify", "Unsalted – weak", "Salt", "High")],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        
+        self.assertEqual(json.loads(parsed_feedback.to_json_bytes()), parsed_feedback.to_dict())
+        with patch('memory_management._jsonlib.orjson', None):
+            self.assertEqual(json.loads(parsed_feedback.to_json_bytes()), parsed_feedback.to_dict())
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, 'feedback.json')
+            parsed_feedback.write_json(output_path)
+            with open(output_path, 'rb') as output_file:
+                self.assertEqual(output_file.read(), parsed_feedback.to_json_bytes())
+    
+    def test_get_parsing_statistics(self):
+        """Test parsing statistics for successful and failed parses."""
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[
+                FeedbackItem("R1", "Accept", "Good", ""),
+                FeedbackItem("R2", "Modify", "Needs work", "Improve this"),
+                FeedbackItem("R3", "Accept", "Fine", "  ")
+            ],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        
+        stats = self.parser.get_parsing_statistics(parsed_feedback)
+        
+        self.assertEqual(stats['total_feedback_items'], 3)
+        self.assertEqual(stats['decision_distribution'], {"Accept": 2, "Modify": 1})
+        self.assertEqual(stats['has_suggestions'], 1)
+        self.assertEqual(stats['average_rationale_length'], 6)
+        
+        failed = ParsedHumanFeedback([], "", False, "LLM extraction failed")
+        self.assertEqual(self.parser.get_parsing_statistics(failed), {
+            'parsing_success': False,
+            'error': "LLM extraction failed",
+            'total_feedback_items': 0
+        })
+    
     def test_map_feedback_to_requirements(self):
         """Test mapping feedback items to requirements."""
         # Create parsed feedback
@@ -283,6 +538,114 @@ This is the most critical error in the report. The agent marked this as "Complia
         self.assertEqual(mapping["R1"]["requirement"]["status"], "Compliant")
         self.assertEqual(mapping["R2"]["feedback"]["decision"], "Modify")
     
+    def test_map_feedback_to_requirement_objects(self):
+        """Test mapping feedback items to requirement objects without dict conversion."""
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[
+                FeedbackItem(
+                    requirement_reference="R2",
+                    decision="Modify",
+                    rationale="Needs improvement",
+                    suggestion="Improve this"
+                )
+            ],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        
+        requirements = [
+            ComplianceRequirement("R1", "Sample requirement 1", "Compliant", "Fine", ""),
+            ComplianceRequirement("R2", "Sample requirement 2", "Non-Compliant", "Missing", "Fix it")
+        ]
+        
+        mapping = self.parser.map_feedback_to_requirements(parsed_feedback, requirements)
+        
+        self.assertEqual(list(mapping), ["R2"])
+        self.assertIs(mapping["R2"]["requirement"], requirements[1])
+        self.assertEqual(mapping["R2"]["feedback"]["decision"], "Modify")
+    
+    def test_map_feedback_unclear_references_batched(self):
+        """Test that several unclear references are resolved with one LLM call."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps({"mappings": [
+                {"item": 2, "requirement_number": "r3"},
+                {"item": 1, "requirement_number": "Requirement R2"}
+            ]}),
+            model="qwq:32b",
+            success=True
+        )
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[
+                FeedbackItem("Retention section", "Modify", "Too simplistic", "Use events"),
+                FeedbackItem(" r1 ", "Accept", "Good analysis", ""),
+                FeedbackItem("", "Modify", "Unsalted hashes are weak", "Salt them")
+            ],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        requirements = [
+            {"requirement_number": "R1", "requirement_text": "User consent requirement"},
+            {"requirement_number": "R2", "requirement_text": "Data retention policy"},
+            {"requirement_number": "R3", "requirement_text": "Password security policy"}
+        ]
+        
+        mapping = self.parser.map_feedback_to_requirements(parsed_feedback, requirements)
+        
+        self.assertEqual(list(mapping), ["R2", "R1", "R3"])
+        self.assertEqual(mapping["R3"]["feedback"]["rationale"], "Unsalted hashes are weak")
+        self.mock_llm_client.generate.assert_not_called()
+        self.assertEqual(self.mock_llm_client.extract_structured_data.call_count, 1)
+        prompt = self.mock_llm_client.extract_structured_data.call_args.kwargs['prompt']
+        self.assertEqual(prompt.count("Password security policy"), 1)
+    
+    def test_map_feedback_batched_item_numbers_coerced(self):
+        """Test that float and string item numbers are accepted and invalid ones skipped."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps({"mappings": [
+                {"item": 2.0, "requirement_number": "R3"},
+                {"item": "1", "requirement_number": "R2"},
+                {"item": 1.5, "requirement_number": "R1"},
+                {"item": 7, "requirement_number": "R1"}
+            ]}),
+            model="qwq:32b",
+            success=True
+        )
+        parsed_feedback = ParsedHumanFeedback(
+            feedback_items=[
+                FeedbackItem("Retention section", "Modify", "Too simplistic", "Use events"),
+                FeedbackItem("", "Modify", "Unsalted hashes are weak", "Salt them")
+            ],
+            raw_text="Sample feedback",
+            parsing_success=True
+        )
+        requirements = [
+            {"requirement_number": "R1", "requirement_text": "User consent requirement"},
+            {"requirement_number": "R2", "requirement_text": "Data retention policy"},
+            {"requirement_number": "R3", "requirement_text": "Password security policy"}
+        ]
+        
+        with self.assertLogs('memory_management.parsers.human_feedback_parser', level='WARNING') as logs:
+            mapping = self.parser.map_feedback_to_requirements(parsed_feedback, requirements)
+        
+        self.assertEqual(list(mapping), ["R2", "R3"])
+        self.assertEqual(len([line for line in logs.output if "Skipping invalid" in line]), 2)
+    
+    def test_format_requirements_reused(self):
+        """Test that the requirements prompt block is rendered once per requirement set."""
+        requirements = [
+            {"requirement_number": "R1", "requirement_text": "User consent requirement"},
+            {"requirement_number": "R2", "requirement_text": "Data retention policy"}
+        ]
+        
+        requirements_text = _format_requirements(requirements)
+        
+        self.assertEqual(requirements_text,
+                         "Requirement R1: User consent requirement\n\nRequirement R2: Data retention policy")
+        self.assertIs(_format_requirements([
+            ComplianceRequirement("R1", "User consent requirement", "Compliant", "", ""),
+            ComplianceRequirement("R2", "Data retention policy", "Compliant", "", "")
+        ]), requirements_text)
+    
     def test_extract_requirement_reference(self):
         """Test extracting requirement reference using LLM."""
         # Mock the LLM client response
@@ -313,6 +676,32 @@ This is the most critical error in the report. The agent marked this as "Complia
         # Verify the result
         self.assertEqual(reference, "R3")
         self.mock_llm_client.generate.assert_called_once()
+        
+        # Repeated lookups for the same item and requirements are memoized
+        self.assertEqual(self.parser._extract_requirement_reference(feedback_item, requirements), "R3")
+        self.mock_llm_client.generate.assert_called_once()
+        
+        # Lower-case answers are normalized; answers without a reference give ""
+        self.parser.clear_cache()
+        self.mock_llm_client.generate.return_value = LLMResponse(
+            content="It matches r2.", model="qwq:32b", success=True
+        )
+        self.assertEqual(self.parser._extract_requirement_reference(feedback_item, requirements), "R2")
+        self.parser.clear_cache()
+        self.mock_llm_client.generate.return_value = LLMResponse(
+            content="None of them.", model="qwq:32b", success=True
+        )
+        self.assertEqual(self.parser._extract_requirement_reference(feedback_item, requirements), "")
+        
+        # Failed requests are not memoized
+        self.parser.clear_cache()
+        self.mock_llm_client.generate.reset_mock()
+        self.mock_llm_client.generate.return_value = LLMResponse(
+            content="", model="qwq:32b", success=False, error="LLM API error"
+        )
+        self.assertEqual(self.parser._extract_requirement_reference(feedback_item, requirements), "")
+        self.assertEqual(self.parser._extract_requirement_reference(feedback_item, requirements), "")
+        self.assertEqual(self.mock_llm_client.generate.call_count, 2)
 
 
 if __name__ == '__main__':
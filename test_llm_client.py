@@ -1,11 +1,16 @@
 """Unit tests for LLM client functionality."""
 
+import asyncio
 import json
 import pytest
 import requests
+import sys
 from unittest.mock import Mock, patch, MagicMock
 from memory_management.llm.client import LLMClient, LLMResponse
-from memory_management.llm.prompts import PromptTemplates
+from memory_management.llm.prompts import (
+    TEMPLATES, PromptTemplates, compile_schema_validator, compliance_report_extraction,
+    get_cached_token_segments, precompute_token_prefixes
+)
 
 
 class TestLLMClient:
@@ -43,6 +48,13 @@ class TestLLMClient:
         assert client.max_retries == 5
         assert client.retry_delay == 2.0
     
+    def test_init_pool_maxsize(self):
+        """Test that the keep-alive pool size is applied to the session adapters."""
+        client = LLMClient(pool_maxsize=32)
+        
+        assert client.pool_maxsize == 32
+        assert client.session.get_adapter("http://localhost")._pool_maxsize == 32
+    
     @patch('requests.Session.post')
     def test_make_request_success(self, mock_post):
         """Test successful API request."""
@@ -84,6 +96,74 @@ class TestLLMClient:
         with pytest.raises(requests.exceptions.HTTPError):
             self.client._make_request('api/generate', {'test': 'data'})
     
+    @patch('requests.Session.post')
+    def test_make_request_stream(self, mock_post):
+        """Test that streamed chunks are merged into a single response."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_lines.return_value = [
+            b'{"response": "Hello", "done": false}',
+            b'',
+            b'{"response": " world", "done": false}',
+            b'{"response": "", "done": true, "eval_count": 2}',
+        ]
+        mock_post.return_value = mock_response
+        
+        result = self.client._make_request('api/generate', {'stream': True})
+        
+        assert result['response'] == "Hello world"
+        assert result['eval_count'] == 2
+        assert mock_post.call_args.kwargs['stream'] is True
+        mock_response.close.assert_called_once()
+    
+    @patch('requests.Session.post')
+    def test_generate_stream_stops_at_json(self, mock_post):
+        """Test that streaming stops once a complete JSON document arrived."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_lines.return_value = iter([
+            b'{"response": "<think>{draft}</think>", "done": false}',
+            b'{"response": "{\\"a\\": ", "done": false}',
+            b'{"response": "1}", "done": false}',
+            b'{"response": " trailing explanation", "done": false}',
+            b'{"response": "", "done": true, "eval_count": 4}',
+        ])
+        mock_post.return_value = mock_response
+        
+        result = self.client.generate("Test prompt", stream=True, stop_at_json=True)
+        
+        assert result.success is True
+        assert result.content == '<think>{draft}</think>{"a": 1}'
+        assert result.tokens_used == 3
+    
+    @patch('requests.Session.post')
+    def test_generate_stream_error_chunk(self, mock_post):
+        """Test that an error reported mid-stream fails the generation."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_lines.return_value = [b'{"error": "model not loaded"}']
+        mock_post.return_value = mock_response
+        
+        result = self.client.generate("Test prompt", stream=True)
+        
+        assert result.success is False
+        assert "model not loaded" in result.error
+    
+    @patch('requests.Session.post')
+    def test_generate_stream_truncated(self, mock_post):
+        """Test that a stream ending without a done chunk fails and is not cached."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_lines.return_value = [b'{"response": "Partial", "done": false}']
+        mock_post.return_value = mock_response
+        
+        result = self.client.generate("Test prompt", stream=True)
+        
+        assert result.success is False
+        assert "ended before completion" in result.error
+        assert len(self.client._response_cache) == 0
+        mock_response.close.assert_called_once()
+    
     @patch.object(LLMClient, '_make_request')
     def test_generate_success(self, mock_request):
         """Test successful text generation."""
@@ -137,6 +217,90 @@ class TestLLMClient:
         assert result.content == ""
         assert "Connection failed" in result.error
     
+    @patch.object(LLMClient, '_make_request')
+    def test_generate_uses_response_cache(self, mock_request):
+        """Test that identical requests are served from the response cache."""
+        mock_request.return_value = {"response": "Cached text", "eval_count": 12}
+        
+        first = self.client.generate("Test prompt", system_prompt="System")
+        second = self.client.generate("Test prompt", system_prompt="System")
+        
+        assert mock_request.call_count == 1
+        assert second.content == first.content == "Cached text"
+        assert second.tokens_used == 12
+        assert second is not first
+        
+        # Different sampling options or an explicit bypass hit the server again
+        self.client.generate("Test prompt", system_prompt="System", temperature=0.5)
+        self.client.generate("Test prompt", system_prompt="System", use_cache=False)
+        assert mock_request.call_count == 3
+    
+    @patch.object(LLMClient, '_make_request')
+    def test_generate_cache_skips_failures_and_evicts(self, mock_request):
+        """Test that failed generations are not cached and the cache stays bounded."""
+        client = LLMClient(cache_size=2)
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+        assert client.generate("p0").success is False
+        
+        mock_request.side_effect = None
+        mock_request.return_value = {"response": "ok"}
+        assert client.generate("p0").success is True
+        for prompt in ["p1", "p2"]:
+            client.generate(prompt)
+        
+        assert len(client._response_cache) == 2
+        client.generate("p0")
+        assert mock_request.call_count == 5
+        
+        client.clear_cache()
+        assert len(client._response_cache) == 0
+    
+    @patch.object(LLMClient, '_make_request')
+    def test_extract_structured_data_caches_only_valid_json(self, mock_request):
+        """Test that malformed JSON output is retried rather than served from the cache."""
+        schema = {"name": "string"}
+        mock_request.return_value = {"response": '{"name": ', "eval_count": 3}
+        assert self.client.extract_structured_data("Extract name", schema).success is False
+        assert len(self.client._response_cache) == 0
+        
+        mock_request.return_value = {"response": '<think>x</think>{"name": "John"}', "eval_count": 5}
+        first = self.client.extract_structured_data("Extract name", schema)
+        second = self.client.extract_structured_data("Extract name", schema)
+        
+        assert mock_request.call_count == 2
+        assert first.parsed == second.parsed == {"name": "John"}
+        assert second.content == '{"name": "John"}'
+        assert second.tokens_used == 5
+    
+    @patch.object(LLMClient, '_make_request')
+    def test_generate_async(self, mock_request):
+        """Test asynchronous text generation wrapper."""
+        mock_request.return_value = {"response": "Async response"}
+        
+        result = asyncio.run(self.client.generate_async("Test prompt", model="gemma3:27b"))
+        
+        assert result.success is True
+        assert result.content == "Async response"
+        assert result.model == "gemma3:27b"
+    
+    @patch.object(LLMClient, '_make_request')
+    def test_generate_batch(self, mock_request):
+        """Test concurrent generation preserves prompt order."""
+        mock_request.side_effect = lambda endpoint, data: {"response": data['prompt'].upper()}
+        
+        results = asyncio.run(self.client.generate_batch(
+            ["first", "second", "third"], max_concurrency=2
+        ))
+        
+        assert [r.content for r in results] == ["FIRST", "SECOND", "THIRD"]
+        assert all(r.success for r in results)
+        assert mock_request.call_count == 3
+    
+    def test_generate_batch_invalid_model(self):
+        """Test batch generation rejects unsupported models up front."""
+        with pytest.raises(ValueError, match="Unsupported model"):
+            asyncio.run(self.client.generate_batch(["prompt"], model="invalid_model"))
+    
     @patch.object(LLMClient, 'generate')
     def test_extract_structured_data_success(self, mock_generate):
         """Test successful structured data extraction."""
@@ -156,6 +320,59 @@ class TestLLMClient:
         parsed_content = json.loads(result.content)
         assert parsed_content["name"] == "John"
         assert parsed_content["age"] == 30
+        assert result.parsed == {"name": "John", "age": 30}
+    
+    @patch.object(LLMClient, 'generate')
+    def test_extract_structured_data_embeds_schema(self, mock_generate):
+        """Test that the schema is rendered into the prompt in its original order."""
+        mock_generate.return_value = LLMResponse(
+            content='{"name": "John", "age": 30}',
+            model="qwq:32b",
+            success=True
+        )
+        
+        schema = {"name": "string", "age": "number"}
+        self.client.extract_structured_data("Extract person info", schema)
+        self.client.extract_structured_data("Extract person info", schema)
+        
+        prompt = mock_generate.call_args.kwargs['prompt']
+        assert json.dumps(schema, indent=2) in prompt
+        assert prompt.startswith("Extract person info")
+    
+    @patch.object(LLMClient, 'generate')
+    def test_extract_structured_data_input_text_after_schema(self, mock_generate):
+        """Test that input text follows the schema so the prompt prefix is shared."""
+        mock_generate.return_value = LLMResponse(
+            content='{"name": "John", "age": 30}',
+            model="qwq:32b",
+            success=True
+        )
+        
+        schema = {"name": "string", "age": "number"}
+        self.client.extract_structured_data("Extract person info", schema)
+        plain_prompt = mock_generate.call_args.kwargs['prompt']
+        self.client.extract_structured_data("Extract person info", schema, input_text="Text:\nJohn, 30")
+        prompt = mock_generate.call_args.kwargs['prompt']
+        
+        static_prefix = plain_prompt[:-len("Response:")]
+        assert prompt == static_prefix + "Text:\nJohn, 30\n\nResponse:"
+    
+    @patch.object(LLMClient, 'generate')
+    def test_extract_structured_data_schema_warnings(self, mock_generate, caplog):
+        """Test that schema mismatches are logged without failing extraction."""
+        mock_generate.return_value = LLMResponse(
+            content='{"items": {"name": "John"}}',
+            model="qwq:32b",
+            success=True
+        )
+        
+        schema = {"items": [{"name": "string"}], "total": "number"}
+        with caplog.at_level("WARNING"):
+            result = self.client.extract_structured_data("Extract data", schema)
+        
+        assert result.success is True
+        assert "Expected key 'items' to be a JSON array" in caplog.text
+        assert "Missing expected key 'total'" in caplog.text
     
     @patch.object(LLMClient, 'generate')
     def test_extract_structured_data_invalid_json(self, mock_generate):
@@ -194,6 +411,17 @@ class TestLLMClient:
         assert result.success is False
         assert result.error == "Generation failed"
     
+    def test_clean_llm_response_strips_reasoning_blocks(self):
+        """Test removal of think/reasoning/analysis blocks and response prefix."""
+        content = (
+            "<THINK>step one\nstep two</THINK>"
+            "<reasoning>why</reasoning>"
+            "<analysis>how</analysis>\n"
+            "Response: {\"key\": \"value\"}"
+        )
+        
+        assert self.client._clean_llm_response(content) == '{"key": "value"}'
+    
     @patch('requests.Session.get')
     def test_check_health_success(self, mock_get):
         """Test successful health check."""
@@ -215,6 +443,25 @@ class TestLLMClient:
             timeout=10
         )
     
+    @patch('requests.Session.get')
+    def test_check_health_result_cached(self, mock_get):
+        """Test that a health check result is reused within the TTL."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "models": [{"name": "qwq:32b"}, {"name": "gemma3:27b"}]
+        }
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        assert self.client.check_health() is True
+        assert self.client.check_health() is True
+        mock_get.assert_called_once()
+        
+        # An expired entry triggers a fresh probe
+        self.client._health_cache = (0.0, True)
+        assert self.client.check_health() is True
+        assert mock_get.call_count == 2
+    
     @patch('requests.Session.get')
     def test_check_health_missing_model(self, mock_get):
         """Test health check with missing required model."""
@@ -231,6 +478,10 @@ class TestLLMClient:
         result = self.client.check_health()
         
         assert result is False
+        
+        # An unhealthy result is not cached
+        assert self.client.check_health() is False
+        assert mock_get.call_count == 2
     
     @patch('requests.Session.get')
     def test_check_health_connection_error(self, mock_get):
@@ -366,6 +617,134 @@ class TestPromptTemplates:
             assert task in system_prompts
             assert isinstance(system_prompts[task], str)
             assert len(system_prompts[task]) > 0
+            assert system_prompts[task].endswith(" Always respond with valid JSON.")
+            assert sys.intern(system_prompts[task]) is system_prompts[task]
+    
+
+    def test_templates_put_static_prefix_first(self):
+        """Test that every template starts with its static prefix and ends with the input."""
+        for template_data in (
+            PromptTemplates.compliance_report_extraction(),
+            PromptTemplates.human_feedback_extraction(),
+            PromptTemplates.scenario_id_generation(),
+            PromptTemplates.ltm_rule_generation(),
+            PromptTemplates.concept_extraction(),
+        ):
+            assert "{" not in template_data["prefix"].replace("{domain}_{requirement_number}_{key_concept}", "")
+            assert "{" in template_data["suffix_template"]
+            assert template_data["template"] == template_data["template"].strip()
+        
+        template_data = PromptTemplates.scenario_id_generation()
+        rendered = template_data["template"].format(
+            requirement_text="Encrypt data", requirement_number="R3"
+        )
+        assert rendered.startswith(template_data["prefix"])
+        assert rendered.endswith("Requirement Number: R3")
+    
+    def test_render_matches_template_format(self):
+        """Test that precompiled renderers produce the same text as str.format."""
+        template_data = PromptTemplates.ltm_rule_generation()
+        values = {
+            "requirement_text": "Store {passwords} hashed",
+            "initial_assessment": "Non-Compliant",
+            "human_feedback": "Add a salt",
+        }
+        
+        render = template_data["render"]
+        assert render(**values) == template_data["template"].format(**values)
+        assert render(*values.values()) == template_data["template"].format(**values)
+    
+    def test_templates_table(self):
+        """Test name-based template lookup and the class namespace."""
+        assert TEMPLATES["compliance_report_extraction"] is compliance_report_extraction
+        assert PromptTemplates.compliance_report_extraction() is compliance_report_extraction()
+        
+        for name, template in TEMPLATES.items():
+            assert template() is getattr(PromptTemplates, name)()
+    
+    def test_json_schema_and_payload_type(self):
+        """Test the JSON Schema and TypedDict derived from each schema description."""
+        template_data = PromptTemplates.ltm_rule_generation()
+        json_schema = template_data["json_schema"]
+        
+        assert json_schema["type"] == "object"
+        assert json_schema["required"] == list(template_data["schema"])
+        assert json_schema["properties"]["related_concepts"] == {"type": "array", "items": {"type": "string"}}
+        assert json_schema["properties"]["confidence_score"] == {"type": "number"}
+        assert set(template_data["payload_type"].__annotations__) == set(template_data["schema"])
+        
+        items = PromptTemplates.compliance_report_extraction()["json_schema"]["properties"]["requirements"]["items"]
+        assert items["required"] == ["requirement_number", "requirement_text", "status", "rationale", "recommendation"]
+    
+    def test_render_batch(self):
+        """Test batch rendering for single- and multi-input templates."""
+        template_data = PromptTemplates.concept_extraction()
+        render = template_data["render"]
+        assert template_data["render_batch"](["a {b}", {"text": "c"}]) == [render("a {b}"), render("c")]
+        
+        template_data = PromptTemplates.scenario_id_generation()
+        inputs = [
+            {"requirement_text": "Encrypt data", "requirement_number": "R1"},
+            {"requirement_text": "Log access", "requirement_number": "R2"},
+        ]
+        assert template_data["render_batch"](inputs) == [template_data["render"](**values) for values in inputs]
+    
+    def test_precompute_token_prefixes(self):
+        """Test that static template segments are tokenized once and cached."""
+        class CharTokenizer:
+            calls = 0
+            
+            def encode(self, text, add_special_tokens=True):
+                assert add_special_tokens is False
+                CharTokenizer.calls += 1
+                return [ord(char) for char in text]
+        
+        assert get_cached_token_segments("unknown_template") is None
+        precompute_token_prefixes(CharTokenizer())
+        
+        template_data = PromptTemplates.concept_extraction()
+        prefix_ids, suffix_ids = get_cached_token_segments("concept_extraction")
+        rendered = template_data["render"]("Consent")
+        expected = [ord(char) for char in rendered]
+        assert list(prefix_ids) + [ord(char) for char in "Consent"] + list(suffix_ids) == expected
+        assert len(get_cached_token_segments("ltm_rule_generation")) == 4
+        assert CharTokenizer.calls == 2 + 2 + 3 + 4 + 2
+    
+    def test_template_validator(self):
+        """Test compiled template schema validators against valid and invalid responses."""
+        validator = compile_schema_validator(PromptTemplates.compliance_report_extraction()["schema"])
+        valid = {"requirements": [{
+            "requirement_number": "R1",
+            "requirement_text": "Text",
+            "status": "Compliant",
+            "rationale": "Because",
+            "recommendation": "None"
+        }]}
+        
+        assert validator(valid) == []
+        
+        invalid = {"requirements": [{"requirement_number": 1, "requirement_text": "Text"}]}
+        problems = validator(invalid)
+        assert "Expected key 'requirements[0].requirement_number' to be a JSON string" in problems
+        assert "Missing expected key 'requirements[0].status'" in problems
+        assert validator([]) == ["Expected a JSON object, got list"]
+        
+        rule_validator = compile_schema_validator(PromptTemplates.ltm_rule_generation()["schema"])
+        problems = rule_validator({
+            "rule_text": "Rule", "related_concepts": ["a"], "policy_area": "GDPR",
+            "confidence_score": True, "applicability": "All"
+        })
+        assert problems == ["Expected key 'confidence_score' to be a JSON number"]
+    
+    def test_templates_are_shared_read_only(self):
+        """Test that templates are built once and cannot be mutated by callers."""
+        first = PromptTemplates.compliance_report_extraction()
+        second = PromptTemplates.compliance_report_extraction()
+        
+        assert first is second
+        assert PromptTemplates.get_system_prompts() is PromptTemplates.get_system_prompts()
+        with pytest.raises(TypeError):
+            first["template"] = "changed"
 
 
 class TestLLMResponse:
@@ -400,6 +779,15 @@ class TestLLMResponse:
         assert response.success is False
         assert response.error == "Connection failed"
         assert response.tokens_used is None
+        assert response.parsed is None
+    
+    def test_llm_response_is_slotted(self):
+        """Test that LLMResponse instances carry no per-instance __dict__."""
+        response = LLMResponse(content="", model="qwq:32b", success=True)
+        
+        assert not hasattr(response, '__dict__')
+        with pytest.raises(AttributeError):
+            response.unexpected = True
 
 
 if __name__ == "__main__":
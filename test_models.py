@@ -3,8 +3,10 @@
 Test script to verify the memory management data models work correctly.
 """
 
+import json
 import sys
 import os
+from dataclasses import asdict
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from memory_management.models import STMEntry, LTMRule
@@ -54,6 +56,82 @@ def test_stm_entry():
     return is_valid
 
 
+def test_stm_entry_json():
+    """Test STM entry serialization to JSON text and bytes."""
+    stm_entry = STMEntry(
+        scenario_id="ecommerce_r1_consent",
+        requirement_text="Users must agree to the terms – explicitly.",
+        initial_assessment=InitialAssessment(
+            status="Non-Compliant",
+            rationale="Bundled consent",
+            recommendation="Separate checkboxes"
+        ),
+        human_feedback=HumanFeedback(
+            decision="No change",
+            rationale="Correct",
+            suggestion="Separate checkboxes"
+        ),
+        final_status="Non-Compliant"
+    )
+    
+    assert stm_entry.to_dict() == asdict(stm_entry)
+    
+    assert stm_entry.created_at == stm_entry.updated_at
+    assert stm_entry.created_at.endswith("Z") and "+" not in stm_entry.created_at
+    
+    json_bytes = stm_entry.to_json_bytes()
+    assert isinstance(json_bytes, bytes)
+    assert json.loads(json_bytes) == stm_entry.to_dict()
+    assert STMEntry.from_dict(json.loads(json_bytes)) == stm_entry
+    
+    data = json.loads(json_bytes)
+    snapshot = json.loads(json_bytes)
+    STMEntry.from_dict(data)
+    assert data == snapshot
+    
+    json_str = stm_entry.to_json()
+    assert "terms – explicitly" in json_str
+    assert STMEntry.from_json(json_str) == stm_entry
+
+
+def test_stm_entry_validate_scenario_id():
+    """Test scenario_id format checks in STMEntry and DataValidator."""
+    def make_entry(scenario_id):
+        return STMEntry(
+            scenario_id=scenario_id,
+            requirement_text="Users must consent.",
+            initial_assessment=InitialAssessment("Non-Compliant", "Bundled", "Separate"),
+            human_feedback=HumanFeedback("No change", "Correct", "Separate"),
+            final_status="Non-Compliant"
+        )
+    
+    for scenario_id, expected in [
+        ("ecommerce_r1_consent", True),
+        ("ecommerce_r1_consent_1", True),
+        ("ecommerce_r1", False),
+    ]:
+        entry = make_entry(scenario_id)
+        assert entry.validate() is expected
+        assert DataValidator.validate_stm_entry(entry)[0] is expected
+    
+    assert DataValidator.validate_ltm_rule(LTMRule(
+        rule_id="GDPR_Hashing",
+        rule_text="Salt password hashes.",
+        related_concepts=["Hashing"],
+        source_scenario_id=["ecommerce_r4_password_hashing"]
+    ))[1] == ["rule_id must follow format: {policy}_{concept}_{version}"]
+
+
+def test_nested_validate_requires_all_fields():
+    """Test that assessment and feedback validation rejects blank fields."""
+    assert InitialAssessment("Compliant", "Hashed", "None").validate() is True
+    assert InitialAssessment("Compliant", "   ", "None").validate() is False
+    assert InitialAssessment("Compliant", "Hashed", "").validate() is False
+    assert HumanFeedback("Agree", "Correct", "None").validate() is True
+    assert HumanFeedback("", "Correct", "None").validate() is False
+    assert HumanFeedback("Agree", "Correct", "\n").validate() is False
+
+
 def test_ltm_rule():
     """Test LTM rule creation and validation."""
     print("\nTesting LTM Rule...")
@@ -89,6 +167,87 @@ def test_ltm_rule():
     return is_valid
 
 
+def test_ltm_rule_to_dict():
+    """Test LTM rule dictionary conversion."""
+    ltm_rule = LTMRule(
+        rule_id="GDPR_Hashing_Salted_01",
+        rule_text="Password hashing must include a salt.",
+        related_concepts=["Hashing"],
+        source_scenario_id=["ecommerce_r4_password_hashing"],
+        confidence_score=0.95
+    )
+    
+    data = ltm_rule.to_dict()
+    assert list(data) == [
+        "rule_id", "rule_text", "related_concepts", "source_scenario_id",
+        "confidence_score", "version", "created_at", "updated_at"
+    ]
+    assert data["related_concepts"] == ["Hashing"]
+    assert data["related_concepts"] is not ltm_rule.related_concepts
+    assert LTMRule.from_dict(data) == ltm_rule
+    assert not hasattr(ltm_rule, "__dict__")
+
+
+def test_ltm_rule_json_round_trip():
+    """Test LTM rule JSON serialization round trip."""
+    ltm_rule = LTMRule(
+        rule_id="GDPR_Hashing_Salted_01",
+        rule_text="Password hashing must include a salt – always.",
+        related_concepts=["Hashing", "GDPR Article 32"],
+        source_scenario_id=["ecommerce_r4_password_hashing"],
+        confidence_score=0.95
+    )
+    
+    json_str = ltm_rule.to_json()
+    assert isinstance(json_str, str)
+    assert "salt – always" in json_str
+    assert LTMRule.from_json(json_str) == ltm_rule
+
+
+def test_ltm_rule_validate_rule_id():
+    """Test LTM rule validation of the rule_id format."""
+    def make_rule(rule_id):
+        return LTMRule(
+            rule_id=rule_id,
+            rule_text="Password hashing must include a salt.",
+            related_concepts=["Hashing"],
+            source_scenario_id=["ecommerce_r4_password_hashing"],
+            confidence_score=0.9
+        )
+    
+    assert make_rule("GDPR_Hashing_01").validate()
+    assert make_rule("GDPR_Hashing_Salted_01").validate()
+    assert not make_rule("GDPR_Hashing").validate()
+    assert not make_rule("").validate()
+
+
+def test_ltm_rule_timestamps():
+    """Test LTM rule timestamp defaults and shared batch timestamps."""
+    ltm_rule = LTMRule(
+        rule_id="GDPR_Hashing_Salted_01",
+        rule_text="Password hashing must include a salt.",
+        related_concepts=["Hashing"],
+        source_scenario_id=["ecommerce_r4_password_hashing"]
+    )
+    
+    assert ltm_rule.created_at == ltm_rule.updated_at
+    assert ltm_rule.created_at.endswith("Z") and "+" not in ltm_rule.created_at
+    
+    batch_time = "2024-01-01T12:00:00Z"
+    rules = [
+        LTMRule(
+            rule_id=f"GDPR_Rule_{index:02d}",
+            rule_text="Rule text",
+            related_concepts=["Concept"],
+            source_scenario_id=["ecommerce_r1_consent"],
+            created_at=batch_time,
+            updated_at=batch_time
+        )
+        for index in range(3)
+    ]
+    assert all(rule.created_at == batch_time and rule.updated_at == batch_time for rule in rules)
+
+
 def main():
     """Run all tests."""
     print("Testing Memory Management Data Models")
@@ -12,7 +12,7 @@ class TestComplianceReportParserIntegration:
     @pytest.fixture
     def parser(self):
         """Create a real ComplianceReportParser instance."""
-        return ComplianceReportParser()
+        return ComplianceReportParser(keep_raw_text=True)
     
     def test_parse_actual_compliance_report(self, parser):
         """Test parsing the actual compliance report file."""
@@ -112,6 +112,65 @@ class TestScenarioIdGenerator:
         
         assert len(self.generator._generated_ids) == 3
     
+    def test_generate_scenario_ids_batch(self):
+        """Test batch generation keeps input order and uniqueness suffixes."""
+        def respond(prompt, **kwargs):
+            key_concept = "encryption" if "encrypt" in prompt else "consent"
+            return LLMResponse(
+                content=json.dumps({
+                    "domain": "ecommerce",
+                    "requirement_number": "r1",
+                    "key_concept": key_concept,
+                    "confidence": 0.9
+                }),
+                model="qwq:32b",
+                success=True
+            )
+        self.mock_llm_client.extract_structured_data.side_effect = respond
+        
+        results = self.generator.generate_scenario_ids([
+            {"requirement_text": "User consent requirement."},
+            {"requirement_text": "Data must be encrypted.", "requirement_number": "r2"},
+            {"requirement_text": "Users must give consent."},
+        ], max_workers=3)
+        
+        assert results == ["ecommerce_r1_consent", "ecommerce_r2_encryption", "ecommerce_r1_consent_1"]
+        assert self.mock_llm_client.extract_structured_data.call_count == 3
+        assert self.generator.generate_scenario_ids([]) == []
+    
+    def test_generate_scenario_id_caches_components(self):
+        """Test that repeated requirements reuse the extracted components."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content=json.dumps({
+                "domain": "ecommerce",
+                "requirement_number": "r1",
+                "key_concept": "consent",
+                "confidence": 0.9
+            }),
+            model="qwq:32b",
+            success=True
+        )
+        
+        assert self.generator.generate_scenario_id("User consent requirement.") == "ecommerce_r1_consent"
+        assert self.generator.generate_scenario_id("User consent requirement.") == "ecommerce_r1_consent_1"
+        assert self.mock_llm_client.extract_structured_data.call_count == 1
+        
+        self.generator.generate_scenario_id("User consent requirement.", domain="finance")
+        assert self.mock_llm_client.extract_structured_data.call_count == 2
+        
+        self.generator.clear_cache()
+        self.generator.generate_scenario_id("User consent requirement.")
+        assert self.mock_llm_client.extract_structured_data.call_count == 3
+    
+    def test_generate_scenario_ids_failure(self):
+        """Test that a failed extraction fails the batch."""
+        self.mock_llm_client.extract_structured_data.return_value = LLMResponse(
+            content="", model="qwq:32b", success=False, error="Connection timeout"
+        )
+        
+        with pytest.raises(ValueError, match="Scenario ID generation failed"):
+            self.generator.generate_scenario_ids([{"requirement_text": "Some requirement text."}])
+    
     def test_generate_scenario_id_llm_failure(self):
         """Test handling of LLM extraction failure."""
         # Mock LLM failure